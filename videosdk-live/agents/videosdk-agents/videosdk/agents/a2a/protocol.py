@@ -322,7 +322,8 @@ class A2AProtocol:
                 }
                 sender_span = traces_flow_manager.create_a2a_trace(
                     "Message Sent",
-                    attributes
+                    attributes,
+                    exchange_id=message.id
                 )
             except Exception as e:
                 print(f"Failed to create sender A2A trace: {e}")
@@ -366,7 +367,9 @@ class A2AProtocol:
                 }
                 receiver_span = traces_flow_manager.create_a2a_trace(
                     "Message Received",
-                    attributes
+                    attributes,
+                    linked_span_context=sender_span.get_span_context() if sender_span else None,
+                    exchange_id=message.id
                 )
             except Exception as e:
                 print(f"Failed to create receiver A2A trace: {e}")
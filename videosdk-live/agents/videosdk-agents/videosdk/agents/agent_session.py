@@ -129,6 +129,11 @@ class AgentSession(EventEmitter[Literal["user_state_changed", "agent_state_chang
             payload = {"state": state.value, **(data or {})}
             self.emit("agent_state_changed", payload)
 
+    def _emit_state_transition(self, user_state: UserState, agent_state: AgentState) -> None:
+        """Emit a paired user/agent state change in one call, skipping unchanged states."""
+        self._emit_user_state(user_state)
+        self._emit_agent_state(agent_state)
+
     @property
     def user_state(self) -> UserState:
         return self._user_state
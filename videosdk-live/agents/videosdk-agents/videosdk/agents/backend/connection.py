@@ -244,6 +244,20 @@ class BackendConnection:
 
         await self._msg_queue.put(message)
 
+    async def send_raw(self, data: str):
+        """Send an already serialized JSON message to the backend."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to backend")
+
+        await self._msg_queue.put(data)
+
+    def send_message_nowait(self, message: WorkerMessage):
+        """Queue a message for the backend without awaiting."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to backend")
+
+        self._msg_queue.put_nowait(message)
+
     async def _connection_loop(self):
         """Main connection loop with retry logic."""
         logger.info("Connection loop started")
@@ -399,13 +413,24 @@ class BackendConnection:
         while not self._closed and self._ws:
             try:
                 msg = await asyncio.wait_for(self._msg_queue.get(), timeout=1.0)
-                await self._ws.send_str(json.dumps(msg.dict()))
+                await self._ws.send_str(self._serialize(msg))
+                # Flush everything queued meanwhile in the same wakeup
+                while not self._msg_queue.empty():
+                    msg = self._msg_queue.get_nowait()
+                    await self._ws.send_str(self._serialize(msg))
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
                 logger.error(f"Error sending message: {e}")
                 break
 
+    @staticmethod
+    def _serialize(msg) -> str:
+        """Serialize a queued message; strings from send_raw pass through."""
+        if isinstance(msg, str):
+            return msg
+        return json.dumps(msg.dict())
+
     async def _recv_loop(self):
         """Receive messages from the backend."""
         while not self._closed and self._ws:
@@ -35,6 +35,9 @@ class EventEmitter(Generic[T]):
             if not self._handlers[event]:
                 del self._handlers[event]
 
+    def has_listeners(self, event: T) -> bool:
+        return bool(self._handlers.get(event))
+
     def emit(self, event: T, *args: Any) -> None:
         callbacks = self._handlers.get(event)
         if not callbacks:
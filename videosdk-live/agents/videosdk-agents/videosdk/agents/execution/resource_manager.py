@@ -119,8 +119,13 @@ class ResourceManager:
             f"Creating {initial_count} initial {self.config.resource_type.value} resources"
         )
 
-        for i in range(initial_count):
-            await self._create_resource(self.config.resource_type)
+        # Spawn the idle pool concurrently so startup pays one spawn latency, not N
+        await asyncio.gather(
+            *(
+                self._create_resource(self.config.resource_type)
+                for _ in range(initial_count)
+            )
+        )
 
     async def _create_resource(self, resource_type: ResourceType) -> BaseResource:
         """Create a new resource of the specified type."""
@@ -57,7 +57,7 @@ else:
     _default_executor_type = ExecutorType.PROCESS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceConfig:
     """Configuration for resource management."""
 
@@ -12,6 +12,13 @@ import logging
 import requests
 import sys
 
+try:
+    import uvloop
+
+    _UVLOOP_AVAILABLE = True
+except Exception:
+    _UVLOOP_AVAILABLE = False
+
 if TYPE_CHECKING:
     from .worker import ExecutorType, WorkerPermissions, _default_executor_type
 else:
@@ -178,7 +185,11 @@ class WorkerJob:
                 # Set the current job context and run the entrypoint
                 token = _set_current_job_context(job_context)
                 try:
-                    asyncio.run(self.entrypoint(job_context))
+                    if _UVLOOP_AVAILABLE:
+                        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                            runner.run(self.entrypoint(job_context))
+                    else:
+                        asyncio.run(self.entrypoint(job_context))
                 finally:
                     _reset_current_job_context(token)
             else:
@@ -200,6 +211,8 @@ class JobContext:
             "VIDEOSDK_AUTH_TOKEN"
         )
         self.room: Optional[VideoSDKHandler] = None
+        # Resolved by connect() once the room handler has been created (None in console mode)
+        self._room_ready: asyncio.Future = self._loop.create_future()
         self._shutdown_callbacks: list[Callable[[], Coroutine[None, None, None]]] = []
         self._is_shutting_down: bool = False
         self.want_console = (len(sys.argv) > 1 and sys.argv[1].lower() == "console")
@@ -268,6 +281,9 @@ class JobContext:
                 if self._pipeline and hasattr(self._pipeline, '_set_loop_and_audio_track'):
                     self._pipeline._set_loop_and_audio_track(self._loop, self.room.audio_track)
 
+        if not self._room_ready.done():
+            self._room_ready.set_result(self.room)
+
         if self.room and self.room_options.join_meeting:
             self.room.init_meeting()
             await self.room.join()
@@ -501,7 +517,7 @@ class JobAcceptArguments:
     metadata: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RunningJobInfo:
     """Information about a running job."""
 
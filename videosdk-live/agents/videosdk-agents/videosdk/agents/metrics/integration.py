@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional
-from opentelemetry.trace import Span
+from typing import Dict, Any, Optional, Sequence
+from opentelemetry.context import Context
+from opentelemetry.trace import Link, Span
 from .telemetry import initialize_telemetry, get_telemetry
 from .logs import initialize_logs, get_logs
 
@@ -41,7 +42,7 @@ def auto_initialize_telemetry_and_logs(room_id: str, peer_id: str,
             sdk_metadata=sdk_metadata,
         )
         
-def create_span(span_name: str, attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None, start_time: Optional[float] = None):
+def create_span(span_name: str, attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None, start_time: Optional[float] = None, links: Optional[Sequence[Link]] = None, parent_context: Optional[Context] = None):
     """
     Create a trace span (convenience method)
     
@@ -50,13 +51,15 @@ def create_span(span_name: str, attributes: Dict[str, Any] = None, parent_span:
         attributes: Span attributes
         parent_span: Parent span (optional)
         start_time: Start time in seconds since epoch (optional)
+        links: Links to related spans outside the parent chain (optional)
+        parent_context: Precomputed parent context, takes precedence over parent_span (optional)
         
     Returns:
         Span object or None
     """
     telemetry = get_telemetry()
     if telemetry:
-        return telemetry.trace(span_name, attributes, parent_span, start_time)
+        return telemetry.trace(span_name, attributes, parent_span, start_time, links, parent_context)
     return None
 
 
@@ -75,7 +78,7 @@ def complete_span(span: Optional[Span], status_code, message: str = "", end_time
         telemetry.complete_span(span, status_code, message, end_time)
 
 
-def create_log(message: str, log_level: str = "INFO", attributes: Dict[str, Any] = None):
+def create_log(message: str, log_level: str = "INFO", attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None):
     """
     Create a log entry (convenience method)
     
@@ -83,9 +86,10 @@ def create_log(message: str, log_level: str = "INFO", attributes: Dict[str, Any]
         message: Log message
         log_level: Log level
         attributes: Additional attributes
+        parent_span: Span to correlate the log with (optional, defaults to the current span)
     """
     logs = get_logs()
     if logs:
-        logs.create_log(message, log_level, attributes)
+        logs.create_log(message, log_level, attributes, parent_span)
 
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Dict, Any, Optional
-from opentelemetry.trace import get_current_span
+from opentelemetry.trace import Span, get_current_span
 import asyncio
 import aiohttp
 
@@ -123,7 +123,7 @@ class VideoSDKLogs:
             print(f"[LOGS EXCEPTION] Error pushing log: {e}")
             return {}
 
-    def create_log(self, message: str, log_level: str, attributes: Dict[str, Any] = None):
+    def create_log(self, message: str, log_level: str, attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None):
         """
         Create a log entry (compatibility method)
 
@@ -131,9 +131,10 @@ class VideoSDKLogs:
             message: Log message
             log_level: Log level (DEBUG, INFO, WARN, ERROR)
             attributes: Additional attributes
+            parent_span: Span to correlate the log with (optional, defaults to the current span)
         """
 
-        span = get_current_span()
+        span = parent_span if parent_span is not None else get_current_span()
         span_context = span.get_span_context() if span else None
 
         if attributes is None:
@@ -12,7 +12,7 @@ class TimelineEvent:
     duration_ms: Optional[float] = None
     text: str = "" 
 
-@dataclass
+@dataclass(slots=True)
 class CascadingTurnData:
     """Data structure for a single user-agent turn"""
     user_speech_start_time: Optional[float] = None
@@ -92,7 +92,7 @@ class CascadingMetricsData:
     eou_model_name: str = ""
     
 
-@dataclass
+@dataclass(slots=True)
 class RealtimeTurnData:
     """
     Captures a single turn between user and agent.
@@ -1,12 +1,13 @@
 import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 import uuid
 from opentelemetry import trace
+from opentelemetry.context import Context
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.trace import Status, StatusCode, Span
+from opentelemetry.trace import Link, Status, StatusCode, Span
 import time
 
 def generate_id():
@@ -82,18 +83,23 @@ class VideoSDKTelemetry:
         except Exception as e:
             print(f"[TELEMETRY ERROR] Failed to initialize telemetry: {e}")
     
-    def trace(self, span_name: str, attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None, start_time: Optional[float] = None) -> Optional[Span]:
+    def trace(self, span_name: str, attributes: Dict[str, Any] = None, parent_span: Optional[Span] = None, start_time: Optional[float] = None, links: Optional[Sequence[Link]] = None, parent_context: Optional[Context] = None) -> Optional[Span]:
         """
         Create a new trace span. If a parent is provided, the new span will be a
         child of it. Otherwise, it will be a child of the currently active span
-        in the context.
+        in the context. Links relate the span to spans outside its parent chain.
+        A precomputed parent_context can be passed to reuse one context for many
+        sibling spans.
         """
         if not self.traces_enabled or not self.tracer:
             return None
             
         try:
  
-            ctx = trace.set_span_in_context(parent_span) if parent_span else None
+            if parent_context is not None:
+                ctx = parent_context
+            else:
+                ctx = trace.set_span_in_context(parent_span) if parent_span else None
             
             attiribute_id = generate_id()
             
@@ -107,11 +113,13 @@ class VideoSDKTelemetry:
                 "start_absolute_time": start_absolute_time # time.time()
             }
             span_kwargs["start_time"] = int(start_absolute_time)
+            if links:
+                span_kwargs["links"] = links
             span = self.tracer.start_span(span_name, **span_kwargs)
                 
             if attributes:
                 for key, value in attributes.items():
-                    span.set_attribute(key, str(value))
+                    span.set_attribute(key, value if isinstance(value, str) else str(value))
             
             return span
                 
@@ -1,11 +1,39 @@
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from opentelemetry.trace import Span, StatusCode
-from opentelemetry import trace
+from opentelemetry.trace import Link, Span, SpanContext, StatusCode
+from opentelemetry import metrics, trace
 from .integration import create_span, complete_span, create_log
 from .models import CascadingTurnData, RealtimeTurnData
 import asyncio
+import functools
+import logging
+import os
 import time
 
+logger = logging.getLogger(__name__)
+
+_TRACING_ENABLED = os.getenv("VIDEOSDK_TRACING", "1") == "1"
+
+# Pending per-exchange sampling decisions kept while waiting for the other side of the exchange
+_A2A_EXCHANGE_CACHE_SIZE = 1024
+
+_a2a_events_dropped = metrics.get_meter(__name__).create_counter(
+    "a2a_events_dropped",
+    description="A2A events that were not traced due to sampling or the span cap",
+)
+
+_TIMELINE_SPAN_NAMES = {
+    "user_speech": "User Input Speech",
+    "agent_speech": "Agent Output Speech",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _phase_span_name(provider_class: str, phase: str) -> str:
+    """Span name for a pipeline phase; provider classes are fixed per session so names are cached."""
+    return f"{provider_class}: {phase}"
+
+
 class TracesFlowManager:
     """
     Manages the flow of OpenTelemetry traces for agent Turns,
@@ -22,8 +50,13 @@ class TracesFlowManager:
         self.agent_session_closed_span: Optional[Span] = None
         self._turn_count = 0
         self.root_span_ready = asyncio.Event()
-        self.a2a_span: Optional[Span] = None
+        self._root_ready = False
         self._a2a_turn_count = 0
+        self._a2a_sample_every = max(1, int(os.getenv("VIDEOSDK_A2A_SAMPLE", "1")))
+        self._a2a_max_spans = 1000
+        # Sampling decisions per message id, so both sides of an exchange are kept or dropped together
+        self._a2a_sample_seq = 0
+        self._a2a_exchange_sampled: "OrderedDict[str, bool]" = OrderedDict()
 
     def set_session_id(self, session_id: str):
         """Set the session ID for the trace manager."""
@@ -32,7 +65,7 @@ class TracesFlowManager:
     def start_agent_joined_meeting(self, attributes: Dict[str, Any]):
         """Starts the root span for the agent joining a meeting."""
         if self.root_span:
-            print("Root span 'Agent Joined Meeting' already exists.")
+            logger.debug("Root span 'Agent Joined Meeting' already exists.")
             return
         
         agent_name = attributes.get('agent_name', 'UnknownAgent')
@@ -44,26 +77,26 @@ class TracesFlowManager:
         self.root_span = create_span(span_name, attributes, start_time=start_time)
 
         if self.root_span:
+            self._root_ready = True
             self.root_span_ready.set()
-            with trace.use_span(self.root_span):
-                create_log("Agent Session Started", "INFO", { "meeting_id": self.room_id })
+            create_log("Agent Session Started", "INFO", { "meeting_id": self.room_id }, parent_span=self.root_span)
 
     async def start_agent_session_config(self, attributes: Dict[str, Any]):
         """Starts the span for the agent's session configuration, child of the root span."""
-        await self.root_span_ready.wait()
+        if not self._root_ready:
+            await self.root_span_ready.wait()
         if not self.root_span:
-            print("Cannot start agent session config span without a root span.")
+            logger.debug("Cannot start agent session config span without a root span.")
             return
 
         if self.agent_session_config_span:
-            print("Agent session config span already exists.")
+            logger.debug("Agent session config span already exists.")
             return
 
         start_time = attributes.get('start_time', time.perf_counter())
         self.agent_session_config_span = create_span("Session Configuration", attributes, parent_span=self.root_span, start_time=start_time)
         if self.agent_session_config_span:
-            with trace.use_span(self.agent_session_config_span):
-                create_log("Agent session config created", "INFO", attributes)
+            create_log("Agent session config created", "INFO", attributes, parent_span=self.agent_session_config_span)
 
     def end_agent_session_config(self):
         """Completes the agent session config span."""
@@ -73,20 +106,20 @@ class TracesFlowManager:
 
     async def start_agent_session_closed(self, attributes: Dict[str, Any]):
         """Starts the span for agent session closed."""
-        await self.root_span_ready.wait()
+        if not self._root_ready:
+            await self.root_span_ready.wait()
         if not self.root_span:
-            print("Cannot start agent session closed span without a root span.")
+            logger.debug("Cannot start agent session closed span without a root span.")
             return
 
         if self.agent_session_closed_span:
-            print("Agent session closed span already exists.")
+            logger.debug("Agent session closed span already exists.")
             return
 
         start_time = attributes.get('start_time', time.perf_counter())
         self.agent_session_closed_span = create_span("Agent Session Closed", attributes, parent_span=self.root_span, start_time=start_time)
         if self.agent_session_closed_span:
-            with trace.use_span(self.agent_session_closed_span):
-                create_log("Agent session closed span created", "INFO", attributes)
+            create_log("Agent session closed span created", "INFO", attributes, parent_span=self.agent_session_closed_span)
 
     def end_agent_session_closed(self):
         """Completes the agent session closed span."""
@@ -96,40 +129,39 @@ class TracesFlowManager:
 
     async def start_agent_session(self, attributes: Dict[str, Any]):
         """Starts the span for the agent's session, child of the root span."""
-        await self.root_span_ready.wait()
+        if not self._root_ready:
+            await self.root_span_ready.wait()
         if not self.root_span:
-            print("Cannot start agent session span without a root span.")
+            logger.debug("Cannot start agent session span without a root span.")
             return
 
         if self.agent_session_span:
-            print("Agent session span already exists.")
+            logger.debug("Agent session span already exists.")
             return
 
         start_time = attributes.get('start_time', time.perf_counter())
         self.agent_session_span = create_span("Session Started", attributes, parent_span=self.root_span, start_time=start_time)
         if self.agent_session_span:
-            with trace.use_span(self.agent_session_span):
-                create_log("Agent session started", "INFO", {
-                    "session_id": self.session_id,
-                })
+            create_log("Agent session started", "INFO", {
+                "session_id": self.session_id,
+            }, parent_span=self.agent_session_span)
         
         self.start_main_turn()
 
     def start_main_turn(self):
         """Starts a parent span for all user-agent turn."""
         if not self.agent_session_span:
-            print("Cannot start main turn span without an agent session span.")
+            logger.debug("Cannot start main turn span without an agent session span.")
             return
 
         if self.main_turn_span:
-            print("Main turn span already exists.")
+            logger.debug("Main turn span already exists.")
             return
             
         start_time = time.perf_counter()
         self.main_turn_span = create_span("User & Agent Turns", parent_span=self.agent_session_span, start_time=start_time)
         if self.main_turn_span:
-            with trace.use_span(self.main_turn_span):
-                create_log("Main Turn span started, ready for user turns.", "INFO")
+            create_log("Main Turn span started, ready for user turns.", "INFO", parent_span=self.main_turn_span)
 
     def create_cascading_turn_trace(self, cascading_turn_data: CascadingTurnData):
         """
@@ -137,10 +169,18 @@ class TracesFlowManager:
         This includes the parent turn span and all its processing child spans.
         """
         if not self.main_turn_span:
-            print("ERROR: Cannot create cascading turn trace without a main turn span.")
+            logger.debug("Cannot create cascading turn trace without a main turn span.")
             return
 
         self._turn_count += 1
+        if not _TRACING_ENABLED or not self.main_turn_span.is_recording():
+            return
+
+        _create_span = create_span
+        _create_log = create_log
+        _end_span = self.end_span
+        _close_ok = self._close_ok
+
         turn_name = f"Turn #{self._turn_count}"
 
         if self._turn_count == 1:
@@ -148,159 +188,157 @@ class TracesFlowManager:
         else: 
             turn_span_start_time = cascading_turn_data.user_speech_start_time if cascading_turn_data.user_speech_start_time else None
        
-        turn_span = create_span(turn_name,parent_span=self.main_turn_span, start_time=turn_span_start_time)
+        turn_span = _create_span(turn_name,parent_span=self.main_turn_span, start_time=turn_span_start_time)
         if turn_span:
-            with trace.use_span(turn_span):
-                create_log(f"Turn Started: {turn_name}", "INFO")
+            _create_log(f"Turn Started: {turn_name}", "INFO", parent_span=turn_span)
 
         if not turn_span:
             return
 
-        with trace.use_span(turn_span, end_on_exit=False):
-            stt_errors = [e for e in cascading_turn_data.errors if e['source'] == 'STT']
-            if cascading_turn_data.stt_start_time is not None or cascading_turn_data.stt_end_time is not None or stt_errors:
-                create_log(f"{cascading_turn_data.stt_provider_class}: Speech to Text Processing Started", "INFO")
-                stt_span_name = f"{cascading_turn_data.stt_provider_class}: Speech to Text Processing"
-
-                stt_attrs = {}
-                if cascading_turn_data.stt_provider_class:
-                    stt_attrs["provider_class"] = cascading_turn_data.stt_provider_class
-                if cascading_turn_data.stt_model_name:
-                    stt_attrs["model_name"] = cascading_turn_data.stt_model_name
-                if cascading_turn_data.stt_latency:
-                    stt_attrs["duration_ms"] = cascading_turn_data.stt_latency
-                if cascading_turn_data.stt_start_time:
-                    stt_attrs["start_timestamp"] = cascading_turn_data.stt_start_time
-                if cascading_turn_data.stt_end_time:
-                    stt_attrs["end_timestamp"] = cascading_turn_data.stt_end_time
+        turn_ctx = trace.set_span_in_context(turn_span)
+
+        stt_errors = [e for e in cascading_turn_data.errors if e['source'] == 'STT']
+        if cascading_turn_data.stt_start_time is not None or cascading_turn_data.stt_end_time is not None or stt_errors:
+            stt_span_name = _phase_span_name(cascading_turn_data.stt_provider_class, "Speech to Text Processing")
+            _create_log(f"{stt_span_name} Started", "INFO", parent_span=turn_span)
+
+            stt_attrs = {}
+            if cascading_turn_data.stt_provider_class:
+                stt_attrs["provider_class"] = cascading_turn_data.stt_provider_class
+            if cascading_turn_data.stt_model_name:
+                stt_attrs["model_name"] = cascading_turn_data.stt_model_name
+            if cascading_turn_data.stt_latency:
+                stt_attrs["duration_ms"] = cascading_turn_data.stt_latency
+            if cascading_turn_data.stt_start_time:
+                stt_attrs["start_timestamp"] = cascading_turn_data.stt_start_time
+            if cascading_turn_data.stt_end_time:
+                stt_attrs["end_timestamp"] = cascading_turn_data.stt_end_time
                 
-                stt_span = create_span(stt_span_name, stt_attrs, parent_span=turn_span, start_time=cascading_turn_data.stt_start_time)
-
-                if stt_span:
-                    for error in stt_errors:
-                        stt_span.add_event("error", attributes={
-                            "message": error["message"],
-                            "timestamp": error["timestamp"]
-                        })
-
-                    status = StatusCode.ERROR if stt_errors else StatusCode.OK
-                    create_log(f"{cascading_turn_data.stt_provider_class}: Speech to Text Processing Ended with status {status}", "INFO")
-                    self.end_span(stt_span, status_code=status, end_time=cascading_turn_data.stt_end_time)
+            stt_span = _create_span(stt_span_name, stt_attrs, parent_context=turn_ctx, start_time=cascading_turn_data.stt_start_time)
+
+            if stt_span:
+                for error in stt_errors:
+                    stt_span.add_event("error", attributes={
+                        "message": error["message"],
+                        "timestamp": error["timestamp"]
+                    })
+
+                status = StatusCode.ERROR if stt_errors else StatusCode.OK
+                _create_log(f"{stt_span_name} Ended with status {status}", "INFO", parent_span=turn_span)
+                _end_span(stt_span, status_code=status, end_time=cascading_turn_data.stt_end_time)
             
-            eou_errors = [e for e in cascading_turn_data.errors if e['source'] == 'TURN-D']
-            if cascading_turn_data.eou_start_time is not None or cascading_turn_data.eou_end_time is not None or eou_errors:
-                create_log(f"{cascading_turn_data.eou_provider_class}: End-Of-Utterence Detection Started", "INFO")
-                eou_span_name = f"{cascading_turn_data.eou_provider_class}: End-Of-Utterence Detection"
+        eou_errors = [e for e in cascading_turn_data.errors if e['source'] == 'TURN-D']
+        if cascading_turn_data.eou_start_time is not None or cascading_turn_data.eou_end_time is not None or eou_errors:
+            eou_span_name = _phase_span_name(cascading_turn_data.eou_provider_class, "End-Of-Utterence Detection")
+            _create_log(f"{eou_span_name} Started", "INFO", parent_span=turn_span)
       
-                eou_attrs = {}
-                if cascading_turn_data.eou_provider_class:
-                    eou_attrs["provider_class"] = cascading_turn_data.eou_provider_class
-                if cascading_turn_data.eou_model_name:
-                    eou_attrs["model_name"] = cascading_turn_data.eou_model_name
-                if cascading_turn_data.eou_latency:
-                    eou_attrs["duration_ms"] = cascading_turn_data.eou_latency
-                if cascading_turn_data.eou_start_time:
-                    eou_attrs["start_timestamp"] = cascading_turn_data.eou_start_time
-                if cascading_turn_data.eou_end_time:
-                    eou_attrs["end_timestamp"] = cascading_turn_data.eou_end_time
+            eou_attrs = {}
+            if cascading_turn_data.eou_provider_class:
+                eou_attrs["provider_class"] = cascading_turn_data.eou_provider_class
+            if cascading_turn_data.eou_model_name:
+                eou_attrs["model_name"] = cascading_turn_data.eou_model_name
+            if cascading_turn_data.eou_latency:
+                eou_attrs["duration_ms"] = cascading_turn_data.eou_latency
+            if cascading_turn_data.eou_start_time:
+                eou_attrs["start_timestamp"] = cascading_turn_data.eou_start_time
+            if cascading_turn_data.eou_end_time:
+                eou_attrs["end_timestamp"] = cascading_turn_data.eou_end_time
                     
-                eou_span = create_span(eou_span_name, eou_attrs, parent_span=turn_span, start_time=cascading_turn_data.eou_start_time)
-
-                if eou_span:
-                    for error in eou_errors:
-                        eou_span.add_event("error", attributes={
-                            "message": error["message"],
-                            "timestamp": error["timestamp"]
-                        })
-
-                    eou_status = StatusCode.ERROR if eou_errors else StatusCode.OK
-                    create_log(f"{cascading_turn_data.eou_provider_class}: End-Of-Utterence Detection Ended with status {eou_status}", "INFO")
-                    self.end_span(eou_span, status_code=eou_status, end_time=cascading_turn_data.eou_end_time)
-                else:
-                    eou_span = None
-
-            llm_errors = [e for e in cascading_turn_data.errors if e['source'] == 'LLM']
-            if cascading_turn_data.llm_start_time is not None or cascading_turn_data.llm_end_time is not None or llm_errors:
-                create_log(f"{cascading_turn_data.llm_provider_class}: LLM Processing Started", "INFO")
-                llm_span_name = f"{cascading_turn_data.llm_provider_class}: LLM Processing"
-
-                llm_attrs = {}
-                if cascading_turn_data.llm_provider_class:
-                    llm_attrs["provider_class"] = cascading_turn_data.llm_provider_class
-                if cascading_turn_data.llm_model_name:
-                    llm_attrs["model_name"] = cascading_turn_data.llm_model_name
-                if cascading_turn_data.llm_latency:
-                    llm_attrs["duration_ms"] = cascading_turn_data.llm_latency
-                if cascading_turn_data.llm_start_time:
-                    llm_attrs["start_timestamp"] = cascading_turn_data.llm_start_time
-                if cascading_turn_data.llm_end_time:
-                    llm_attrs["end_timestamp"] = cascading_turn_data.llm_end_time
+            eou_span = _create_span(eou_span_name, eou_attrs, parent_context=turn_ctx, start_time=cascading_turn_data.eou_start_time)
+
+            if eou_span:
+                for error in eou_errors:
+                    eou_span.add_event("error", attributes={
+                        "message": error["message"],
+                        "timestamp": error["timestamp"]
+                    })
+
+                eou_status = StatusCode.ERROR if eou_errors else StatusCode.OK
+                _create_log(f"{eou_span_name} Ended with status {eou_status}", "INFO", parent_span=turn_span)
+                _end_span(eou_span, status_code=eou_status, end_time=cascading_turn_data.eou_end_time)
+            else:
+                eou_span = None
+
+        llm_errors = [e for e in cascading_turn_data.errors if e['source'] == 'LLM']
+        if cascading_turn_data.llm_start_time is not None or cascading_turn_data.llm_end_time is not None or llm_errors:
+            llm_span_name = _phase_span_name(cascading_turn_data.llm_provider_class, "LLM Processing")
+            _create_log(f"{llm_span_name} Started", "INFO", parent_span=turn_span)
+
+            llm_attrs = {}
+            if cascading_turn_data.llm_provider_class:
+                llm_attrs["provider_class"] = cascading_turn_data.llm_provider_class
+            if cascading_turn_data.llm_model_name:
+                llm_attrs["model_name"] = cascading_turn_data.llm_model_name
+            if cascading_turn_data.llm_latency:
+                llm_attrs["duration_ms"] = cascading_turn_data.llm_latency
+            if cascading_turn_data.llm_start_time:
+                llm_attrs["start_timestamp"] = cascading_turn_data.llm_start_time
+            if cascading_turn_data.llm_end_time:
+                llm_attrs["end_timestamp"] = cascading_turn_data.llm_end_time
                 
-                llm_span = create_span(llm_span_name, llm_attrs, parent_span=turn_span, start_time=cascading_turn_data.llm_start_time)
-
-                if llm_span:
-
-                    if cascading_turn_data.function_tool_timestamps:
-                        for tool_data in cascading_turn_data.function_tool_timestamps:
-                            tool_timestamp = tool_data["timestamp"]
-                            tool_span = create_span(f"Invoked Tool: {tool_data['tool_name']}", parent_span=llm_span, start_time=tool_timestamp)
-                            self.end_span(tool_span, end_time=tool_timestamp)
-
-                    for error in llm_errors:
-                        llm_span.add_event("error", attributes={
-                            "message": error["message"],
-                            "timestamp": error["timestamp"]
-                        })
-
-                    llm_status = StatusCode.ERROR if llm_errors else StatusCode.OK
-                    create_log(f"{cascading_turn_data.llm_provider_class}: LLM Processing Ended with status {llm_status}", "INFO")
-                    self.end_span(llm_span, status_code=llm_status, end_time=cascading_turn_data.llm_end_time)
-
-            tts_errors = [e for e in cascading_turn_data.errors if e['source'] == 'TTS']
-            if cascading_turn_data.tts_start_time is not None or cascading_turn_data.tts_end_time is not None or tts_errors:
-                create_log(f"{cascading_turn_data.tts_provider_class}: Text to Speech Processing Started", "INFO")
-                tts_span_name = f"{cascading_turn_data.tts_provider_class}: Text to Speech Processing"
-
-                tts_attrs = {}
-                if cascading_turn_data.tts_provider_class:
-                    tts_attrs["provider_class"] = cascading_turn_data.tts_provider_class
-                if cascading_turn_data.tts_model_name:
-                    tts_attrs["model_name"] = cascading_turn_data.tts_model_name
+            llm_span = _create_span(llm_span_name, llm_attrs, parent_context=turn_ctx, start_time=cascading_turn_data.llm_start_time)
+
+            if llm_span:
+
+                if cascading_turn_data.function_tool_timestamps:
+                    for tool_data in cascading_turn_data.function_tool_timestamps:
+                        tool_timestamp = tool_data["timestamp"]
+                        tool_span = _create_span(f"Invoked Tool: {tool_data['tool_name']}", parent_span=llm_span, start_time=tool_timestamp)
+                        _close_ok(tool_span, tool_timestamp)
+
+                for error in llm_errors:
+                    llm_span.add_event("error", attributes={
+                        "message": error["message"],
+                        "timestamp": error["timestamp"]
+                    })
+
+                llm_status = StatusCode.ERROR if llm_errors else StatusCode.OK
+                _create_log(f"{llm_span_name} Ended with status {llm_status}", "INFO", parent_span=turn_span)
+                _end_span(llm_span, status_code=llm_status, end_time=cascading_turn_data.llm_end_time)
+
+        tts_errors = [e for e in cascading_turn_data.errors if e['source'] == 'TTS']
+        if cascading_turn_data.tts_start_time is not None or cascading_turn_data.tts_end_time is not None or tts_errors:
+            tts_span_name = _phase_span_name(cascading_turn_data.tts_provider_class, "Text to Speech Processing")
+            _create_log(f"{tts_span_name} Started", "INFO", parent_span=turn_span)
+
+            tts_attrs = {}
+            if cascading_turn_data.tts_provider_class:
+                tts_attrs["provider_class"] = cascading_turn_data.tts_provider_class
+            if cascading_turn_data.tts_model_name:
+                tts_attrs["model_name"] = cascading_turn_data.tts_model_name
                     
-                tts_span = create_span(tts_span_name, tts_attrs, parent_span=turn_span, start_time=cascading_turn_data.tts_start_time)
+            tts_span = _create_span(tts_span_name, tts_attrs, parent_context=turn_ctx, start_time=cascading_turn_data.tts_start_time)
 
-                if tts_span:
+            if tts_span:
                     
-                    if cascading_turn_data.ttfb is not None:
-                        ttfb_span = create_span("Time to First Byte", parent_span=tts_span, start_time=cascading_turn_data.tts_start_time)
-                        self.end_span(ttfb_span, end_time=cascading_turn_data.ttfb)
-
-                    for error in tts_errors:
-                        tts_span.add_event("error", attributes={
-                            "message": error["message"],
-                            "timestamp": error["timestamp"]
-                        })
-
-                    tts_status = StatusCode.ERROR if tts_errors else StatusCode.OK
-                    create_log(f"{cascading_turn_data.tts_provider_class}: Text to Speech Processing Ended with status {tts_status}", "INFO")
-                    self.end_span(tts_span, status_code=tts_status, end_time=cascading_turn_data.tts_end_time)
-
-            if cascading_turn_data.timeline:
-                for event in cascading_turn_data.timeline:
-                    if event.event_type == "user_speech":
-                        create_log(f"User Input Speech Detected", "INFO")
-                        user_speech_span = create_span("User Input Speech", {"Transcript": event.text}, parent_span=turn_span, start_time=event.start_time)
-                        self.end_span(user_speech_span, end_time=event.end_time)
-                    elif event.event_type == "agent_speech":
-                        create_log(f"Agent Output Speech Detected", "INFO")
-                        agent_speech_span = create_span("Agent Output Speech", {"Transcript": event.text}, parent_span=turn_span, start_time=event.start_time)
-                        self.end_span(agent_speech_span, end_time=event.end_time)    
+                if cascading_turn_data.ttfb is not None:
+                    ttfb_span = _create_span("Time to First Byte", parent_span=tts_span, start_time=cascading_turn_data.tts_start_time)
+                    _close_ok(ttfb_span, cascading_turn_data.ttfb)
+
+                for error in tts_errors:
+                    tts_span.add_event("error", attributes={
+                        "message": error["message"],
+                        "timestamp": error["timestamp"]
+                    })
+
+                tts_status = StatusCode.ERROR if tts_errors else StatusCode.OK
+                _create_log(f"{tts_span_name} Ended with status {tts_status}", "INFO", parent_span=turn_span)
+                _end_span(tts_span, status_code=tts_status, end_time=cascading_turn_data.tts_end_time)
+
+        if cascading_turn_data.timeline:
+            for event in cascading_turn_data.timeline:
+                span_name = _TIMELINE_SPAN_NAMES.get(event.event_type)
+                if not span_name:
+                    continue
+                _create_log(f"{span_name} Detected", "INFO", parent_span=turn_span)
+                speech_span = _create_span(span_name, {"Transcript": event.text}, parent_context=turn_ctx, start_time=event.start_time)
+                _close_ok(speech_span, event.end_time)
 
         if cascading_turn_data.errors:
             vad_turn_errors = [e for e in cascading_turn_data.errors if e['source'] in ['VAD']]
             
             if vad_turn_errors:
-                span_name = f"{cascading_turn_data.vad_provider_class}: VAD Processing Error"
+                span_name = _phase_span_name(cascading_turn_data.vad_provider_class, "VAD Processing Error")
                 
                 vad_attrs = {}
                 if cascading_turn_data.vad_provider_class:
@@ -308,7 +346,7 @@ class TracesFlowManager:
                 if cascading_turn_data.vad_model_name:
                     vad_attrs["model_name"] = cascading_turn_data.vad_model_name
 
-                vad_turn_span = create_span(span_name, vad_attrs, parent_span=turn_span)
+                vad_turn_span = _create_span(span_name, vad_attrs, parent_context=turn_ctx)
                 if vad_turn_span:
                     for error in vad_turn_errors:
                         vad_turn_span.add_event("error", attributes={
@@ -318,19 +356,14 @@ class TracesFlowManager:
                         })
                     
                     status = StatusCode.ERROR
-                    self.end_span(vad_turn_span, status_code=status)
+                    _end_span(vad_turn_span, status_code=status)
         
         if cascading_turn_data.interrupted:
-            interrupted_span = create_span("Turn Interrupted", parent_span=turn_span)
-            self.end_span(interrupted_span, message="Agent was interrupted") 
-
-        turn_end_time = None
-        if cascading_turn_data.tts_end_time:
-            turn_end_time = cascading_turn_data.tts_end_time
-        elif cascading_turn_data.llm_end_time:
-            turn_end_time = cascading_turn_data.llm_end_time 
-        
-        self.end_span(turn_span, message="End of Cascading turn trace.", end_time=turn_end_time)
+            interrupted_span = _create_span("Turn Interrupted", parent_context=turn_ctx)
+            _close_ok(interrupted_span)
+
+        turn_end_time = cascading_turn_data.tts_end_time or cascading_turn_data.llm_end_time or None
+        _close_ok(turn_span, turn_end_time)
 
     def end_main_turn(self):
         """Completes the main turn span."""
@@ -340,7 +373,7 @@ class TracesFlowManager:
     def agent_say_called(self, message: str):
         """Creates a span for the agent's say method."""
         if not self.agent_session_span:
-            print("Cannot create agent say span without an agent session span.")
+            logger.debug("Cannot create agent say span without an agent session span.")
             return
 
         current_span = trace.get_current_span()
@@ -357,7 +390,7 @@ class TracesFlowManager:
     def agent_reply_called(self, instructions: str):
         """Creates a span for an agent reply invocation."""
         if not self.agent_session_span:
-            print("Cannot create agent reply span without an agent session span.")
+            logger.debug("Cannot create agent reply span without an agent session span.")
             return
 
         current_span = trace.get_current_span()
@@ -371,62 +404,73 @@ class TracesFlowManager:
 
         self.end_span(agent_reply_span, "Agent reply span created", end_time=time.perf_counter())
 
-    def create_a2a_trace(self, name: str, attributes: Dict[str, Any]) -> Optional[Span]:
-        """Creates an A2A trace under the main turn span."""
+    def _a2a_sampled(self, exchange_id: Optional[str]) -> bool:
+        """Decides once per exchange whether its A2A events are traced."""
+        if exchange_id is not None:
+            sampled = self._a2a_exchange_sampled.pop(exchange_id, None)
+            if sampled is not None:
+                return sampled
+        sampled = self._a2a_sample_seq % self._a2a_sample_every == 0
+        self._a2a_sample_seq += 1
+        if exchange_id is not None:
+            self._a2a_exchange_sampled[exchange_id] = sampled
+            # Exchanges whose other side never arrives (timeouts, peer errors) age out here
+            if len(self._a2a_exchange_sampled) > _A2A_EXCHANGE_CACHE_SIZE:
+                self._a2a_exchange_sampled.popitem(last=False)
+        return sampled
+
+    def create_a2a_trace(self, name: str, attributes: Dict[str, Any], linked_span_context: Optional[SpanContext] = None, exchange_id: Optional[str] = None) -> Optional[Span]:
+        """
+        Creates an A2A trace under the main turn span.
+        If a peer span context is given, the new span is linked to it.
+        Events sharing an exchange_id (e.g. the sender and receiver side of one
+        message) share a single sampling decision.
+        """
         if not self.main_turn_span:
-            print("Cannot create A2A trace without main turn span.")
+            logger.debug("Cannot create A2A trace without main turn span.")
             return None
 
-        if not self.a2a_span:
-            self.a2a_span = create_span(
-                "Agent-to-Agent Communications",
-                {"total_a2a_turns": self._a2a_turn_count},
-                parent_span=self.main_turn_span
-            )
-            if self.a2a_span:
-                with trace.use_span(self.a2a_span):
-                    create_log("A2A communication started", "INFO")
-
-        if not self.a2a_span:
-            print("Failed to create A2A parent span")
-            return None
+        if self._a2a_turn_count == 0:
+            create_log("A2A communication started", "INFO", parent_span=self.main_turn_span)
 
         self._a2a_turn_count += 1
+        sampled = self._a2a_sampled(exchange_id)
+        if self._a2a_turn_count > self._a2a_max_spans or not sampled:
+            _a2a_events_dropped.add(1, {"event": name})
+            return None
+
         span_name = f"A2A {self._a2a_turn_count}: {name}"
+        links = [Link(linked_span_context)] if linked_span_context and linked_span_context.is_valid else None
         
         a2a_span = create_span(
             span_name, 
             {
                 **attributes,
                 "a2a_turn_number": self._a2a_turn_count,
-                "parent_span": "Agent-to-Agent Communications"
             }, 
-            parent_span=self.a2a_span,
-            start_time=time.perf_counter()
+            parent_span=self.main_turn_span,
+            start_time=time.perf_counter(),
+            links=links
         )
         
         if a2a_span:
-            with trace.use_span(a2a_span):
-                create_log(f"A2A event: {name}", "INFO", attributes)
+            create_log(f"A2A event: {name}", "INFO", attributes, parent_span=a2a_span)
         
         return a2a_span
 
     def end_a2a_trace(self, span: Optional[Span], message: str = ""):
         """Ends an A2A trace span."""
         if span:
-            with trace.use_span(span):
-                if message:
-                    create_log(message, "INFO")
+            if message:
+                create_log(message, "INFO", parent_span=span)
             complete_span(span, StatusCode.OK, end_time=time.perf_counter())
 
     def end_a2a_communication(self):
-        """Ends the A2A communication parent span."""
-        if self.a2a_span:
-            with trace.use_span(self.a2a_span, start_time=time.perf_counter()):
-                create_log(f"A2A communication ended with {self._a2a_turn_count} turns", "INFO")
-            complete_span(self.a2a_span, StatusCode.OK, end_time=time.perf_counter())
-            self.a2a_span = None
+        """Ends the current A2A communication and resets the A2A turn counter."""
+        if self._a2a_turn_count:
+            create_log(f"A2A communication ended with {self._a2a_turn_count} turns", "INFO", parent_span=self.main_turn_span)
             self._a2a_turn_count = 0  
+        self._a2a_exchange_sampled.clear()
 
     def end_agent_session(self):
         """Completes the agent session span."""
@@ -454,69 +498,77 @@ class TracesFlowManager:
             desc = message if status_code == StatusCode.ERROR else ""
             complete_span(span, status_code, desc, end_time)
 
+    def _close_ok(self, span: Optional[Span], end_time: Optional[float] = None):
+        """Fast path for end_span with an OK status and no message."""
+        if span:
+            complete_span(span, StatusCode.OK, "", time.perf_counter() if end_time is None else end_time)
+
     def create_realtime_turn_trace(self, realtime_turn_data: RealtimeTurnData):
         """
         Creates a full trace for a single realtime turn from its collected metrics data.
         This includes the parent turn span and child spans for speech events, tools, and latencies.
         """
         if not self.main_turn_span:
-            print("ERROR: Cannot create realtime turn trace without a main turn span.")
+            logger.debug("Cannot create realtime turn trace without a main turn span.")
             return
 
         self._turn_count += 1
+        if not _TRACING_ENABLED or not self.main_turn_span.is_recording():
+            return
+
+        _create_span = create_span
+        _create_log = create_log
+        _end_span = self.end_span
+        _close_ok = self._close_ok
+
         turn_name = f"Turn#{self._turn_count}"
         
-        turn_span = create_span(turn_name,parent_span=self.main_turn_span,start_time=time.perf_counter())
+        turn_span = _create_span(turn_name,parent_span=self.main_turn_span,start_time=time.perf_counter())
         if turn_span:
-            with trace.use_span(turn_span):
-                create_log(f"Realtime Turn {turn_name} started", "INFO")
+            _create_log(f"Realtime Turn {turn_name} started", "INFO", parent_span=turn_span)
 
         if not turn_span:
             return
 
-        with trace.use_span(turn_span, end_on_exit=False):
-
-            if realtime_turn_data.timeline:
-                for event in realtime_turn_data.timeline:
-                    if event.event_type == "user_speech":
-                        span_name = f"User Input Speech"
-                        user_speech_span = create_span(span_name, {
-                            "duration_ms": event.duration_ms, 
-                            "text": event.text
-                        }, parent_span=turn_span,start_time=event.start_time)
-                        self.end_span(user_speech_span,end_time=event.end_time)
-                    elif event.event_type == "agent_speech":
-                        span_name = f"Agent Output Speech"
-                        agent_speech_span = create_span(span_name, {
-                            "duration_ms": event.duration_ms, 
-                            "text": event.text
-                        }, parent_span=turn_span,start_time=event.start_time)
-                        self.end_span(agent_speech_span,end_time=event.end_time)
-
-            if realtime_turn_data.function_tools_called:
-                for i, tool in enumerate(realtime_turn_data.function_tools_called, 1):
-                    tool_span = create_span(f"Invoked Tool: {tool}", parent_span=turn_span,start_time=time.perf_counter())
-                    self.end_span(tool_span,end_time=time.perf_counter())
-
-            if realtime_turn_data.ttfb is not None:
-                ttfb_span = create_span("Time to First Word", {"duration_ms": realtime_turn_data.ttfb}, parent_span=turn_span,start_time=time.perf_counter())
-                self.end_span(ttfb_span,end_time=time.perf_counter())
-
-            if realtime_turn_data.interrupted is not None:
-                interrupted_span = create_span("Turn Interrupted", parent_span=turn_span,start_time=time.perf_counter())
-                self.end_span(interrupted_span, message="Agent was interrupted", end_time=time.perf_counter())
-
-            if realtime_turn_data.realtime_model_errors:
-                for error in realtime_turn_data.realtime_model_errors:
-                    turn_span.add_event(
-                        name="Errors",
-                        attributes={
-                            "message": error.get("message", "Unknown error"),
-                            "timestamp": error.get("timestamp", "N/A"),
-                        }
-                    )
-                model_status = StatusCode.ERROR
-            else:
-                model_status = StatusCode.OK
+        turn_ctx = trace.set_span_in_context(turn_span)
+
+        if realtime_turn_data.timeline:
+            for event in realtime_turn_data.timeline:
+                span_name = _TIMELINE_SPAN_NAMES.get(event.event_type)
+                if not span_name:
+                    continue
+                speech_span = _create_span(span_name, {
+                    "duration_ms": event.duration_ms, 
+                    "text": event.text
+                }, parent_context=turn_ctx,start_time=event.start_time)
+                _close_ok(speech_span, event.end_time)
+
+        end_ts = time.perf_counter()
+
+        if realtime_turn_data.function_tools_called:
+            for tool in realtime_turn_data.function_tools_called:
+                tool_span = _create_span(f"Invoked Tool: {tool}", parent_context=turn_ctx, start_time=end_ts)
+                _close_ok(tool_span, end_ts)
+
+        if realtime_turn_data.ttfb is not None:
+            ttfb_span = _create_span("Time to First Word", {"duration_ms": realtime_turn_data.ttfb}, parent_context=turn_ctx, start_time=end_ts)
+            _close_ok(ttfb_span, end_ts)
+
+        if realtime_turn_data.interrupted is not None:
+            interrupted_span = _create_span("Turn Interrupted", parent_context=turn_ctx, start_time=end_ts)
+            _close_ok(interrupted_span, end_ts)
+
+        if realtime_turn_data.realtime_model_errors:
+            for error in realtime_turn_data.realtime_model_errors:
+                turn_span.add_event(
+                    name="Errors",
+                    attributes={
+                        "message": error.get("message", "Unknown error"),
+                        "timestamp": error.get("timestamp", "N/A"),
+                    }
+                )
+            model_status = StatusCode.ERROR
+        else:
+            model_status = StatusCode.OK
             
-        self.end_span(turn_span, message="End of Realtime Turn trace", status_code=model_status, end_time=time.perf_counter()) 
\ No newline at end of file
+        _end_span(turn_span, message="End of Realtime Turn trace", status_code=model_status, end_time=end_ts) 
\ No newline at end of file
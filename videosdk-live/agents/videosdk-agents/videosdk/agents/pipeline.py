@@ -7,6 +7,11 @@ from .room.audio_stream import CustomAudioStreamTrack
 import logging
 logger = logging.getLogger(__name__)
 
+
+def _noop() -> None:
+    return None
+
+
 class Pipeline(EventEmitter[Literal["start"]], ABC):
     """
     Base Pipeline class that other pipeline types (RealTime, Cascading) will inherit from.
@@ -43,6 +48,7 @@ class Pipeline(EventEmitter[Literal["start"]], ABC):
 
     def set_wake_up_callback(self, callback: Callable[[], None]) -> None:
         self._wake_up_callback = callback
+        self._notify_speech_started = callback if callback else _noop
 
     def _notify_speech_started(self) -> None:
         if self._wake_up_callback:
@@ -81,6 +87,7 @@ class Pipeline(EventEmitter[Literal["start"]], ABC):
         self.loop = None
         self.audio_track = None
         self._wake_up_callback = None
+        self._notify_speech_started = _noop
         logger.info("Pipeline cleaned up")
     
     async def leave(self) -> None:
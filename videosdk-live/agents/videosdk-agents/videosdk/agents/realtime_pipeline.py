@@ -5,6 +5,7 @@ from typing import Any, Literal
 import av
 import time
 import asyncio
+import numpy as np
 from .pipeline import Pipeline
 from .event_emitter import EventEmitter
 from .realtime_base_model import RealtimeBaseModel
@@ -18,6 +19,33 @@ from .background_audio import BackgroundAudio, BackgroundAudioConfig
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except Exception:
+    _NUMBA_AVAILABLE = False
+
+
+def _strided_peak_numpy(samples: np.ndarray, stride: int) -> int:
+    strided = samples[::stride]
+    return int(np.abs(strided.astype(np.int32)).max()) if strided.size else 0
+
+
+def _strided_peak_loop(samples: np.ndarray, stride: int) -> int:
+    peak = 0
+    for i in range(0, samples.shape[0], stride):
+        value = abs(int(samples[i]))
+        if value > peak:
+            peak = value
+    return peak
+
+
+if _NUMBA_AVAILABLE:
+    # Without an explicit signature numba compiles on the first call, not at import
+    _strided_peak = njit(_strided_peak_loop)
+else:
+    _strided_peak = _strided_peak_numpy
+
 class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtime_end","user_audio_input_data", "user_speech_started", "realtime_model_transcription"]]):
     """
     RealTime pipeline implementation that processes data in real-time.
@@ -29,6 +57,7 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
         model: RealtimeBaseModel,
         avatar: Any | None = None,
         denoise: Denoise | None = None,
+        denoise_silence_threshold: int = 0,
     ) -> None:
         """
         Initialize the realtime pipeline.
@@ -38,16 +67,25 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
             config: Configuration dictionary with settings like:
                    - response_modalities: List of enabled modalities
                    - silence_threshold_ms: Silence threshold in milliseconds
+            denoise_silence_threshold: Peak int16 amplitude below which input audio
+                   skips denoising and is forwarded as silence (0, the default, denoises every chunk)
         """
         self.model = model
         self.model.audio_track = None
+        self._model_has_video = hasattr(model, 'handle_video_input')
+        self._model_has_send_text = hasattr(model, 'send_text_message')
         self.agent = None
         self.avatar = avatar
         self.vision = False
         self.denoise = denoise
+        self.denoise_silence_threshold = denoise_silence_threshold
         self.background_audio: BackgroundAudioConfig | None = None
         self._background_audio_player: BackgroundAudio | None = None
         super().__init__()
+        self._speech_events: asyncio.Queue = asyncio.Queue()
+        self._speech_event_task: asyncio.Task | None = None
+        self._user_speech_ended_handler = lambda data: self._speech_events.put_nowait((self.on_user_speech_ended, data))
+        self._agent_speech_started_handler = lambda data: self._speech_events.put_nowait((self.on_agent_speech_started, data))
         self.model.on("error", self.on_model_error)
         self.model.on("realtime_model_transcription", self.on_realtime_model_transcription)
 
@@ -86,10 +124,11 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
             **kwargs: Additional arguments for pipeline configuration
         """
         await self.model.connect()
+        if self._speech_event_task is None:
+            self._speech_event_task = asyncio.create_task(self._speech_event_worker())
         self.model.on("user_speech_started", self.on_user_speech_started)
-        self.model.on("user_speech_ended", lambda data: asyncio.create_task(self.on_user_speech_ended(data)))
-        self.model.on("agent_speech_started", lambda data: asyncio.create_task(self.on_agent_speech_started(data)))
-        self.model.on("agent_speech_ended",{})
+        self.model.on("user_speech_ended", self._user_speech_ended_handler)
+        self.model.on("agent_speech_started", self._agent_speech_started_handler)
 
     async def send_message(self, message: str) -> None:
         """
@@ -103,7 +142,7 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
         Send a text message through the realtime model.
         This method specifically handles text-only input when modalities is ["text"].
         """
-        if hasattr(self.model, 'send_text_message'):
+        if self._model_has_send_text:
             await self.model.send_text_message(message)
         else:
             await self.model.send_message(message)
@@ -113,15 +152,27 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
         Handle incoming audio data from the user
         """
         if self.denoise:
-            audio_data = await self.denoise.denoise(audio_data)
+            if self._is_silent(audio_data):
+                audio_data = bytes(len(audio_data))
+            else:
+                audio_data = await self.denoise.denoise(audio_data)
         await self.model.handle_audio_input(audio_data)
 
+    def _is_silent(self, audio_data: bytes) -> bool:
+        """Cheap peak check on every 8th int16 sample to gate denoising of silent input."""
+        if self.denoise_silence_threshold <= 0:
+            return False
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        if samples.size == 0:
+            return True
+        return _strided_peak(samples, 8) < self.denoise_silence_threshold
+
     async def on_video_delta(self, video_data: av.VideoFrame):
         """
         Handle incoming video data from the user
         The model's handle_video_input is now expected to handle the av.VideoFrame.
         """
-        if self.vision and hasattr(self.model, 'handle_video_input'):
+        if self.vision and self._model_has_video:
             await self.model.handle_video_input(video_data)
     
     def on_user_speech_started(self, data: dict) -> None:
@@ -129,9 +180,9 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
         Handle user speech started event
         """
         self._notify_speech_started()
-        if self.agent.session:
-            self.agent.session._emit_user_state(UserState.SPEAKING)
-            self.agent.session._emit_agent_state(AgentState.LISTENING)
+        session = self.agent.session if self.agent else None
+        if session:
+            session._emit_state_transition(UserState.SPEAKING, AgentState.LISTENING)
             
     def interrupt(self) -> None:
         """
@@ -161,6 +212,8 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
         """
         Handle realtime model transcription event
         """
+        if not self.has_listeners("realtime_model_transcription"):
+            return
         try:
             self.emit("realtime_model_transcription", data)
         except Exception:
@@ -170,6 +223,13 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
     async def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up realtime pipeline")
+        if self._speech_event_task is not None:
+            self._speech_event_task.cancel()
+            try:
+                await self._speech_event_task
+            except asyncio.CancelledError:
+                pass
+            self._speech_event_task = None
         if hasattr(self, 'room') and self.room is not None:
             try:
                 await self.room.leave()
@@ -225,6 +285,17 @@ class RealTimePipeline(Pipeline, EventEmitter[Literal["realtime_start", "realtim
             await self._background_audio_player.stop()
             self._background_audio_player = None
 
+    async def _speech_event_worker(self) -> None:
+        """
+        Dispatch queued speech events serially from a single long-lived task
+        """
+        while True:
+            handler, data = await self._speech_events.get()
+            try:
+                await handler(data)
+            except Exception as e:
+                logger.error(f"Error handling speech event: {e}")
+
     async def on_user_speech_ended(self, data: dict) -> None:
         """
         Handle agent turn started event
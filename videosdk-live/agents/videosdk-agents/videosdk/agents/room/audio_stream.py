@@ -1,7 +1,7 @@
 import logging
 import asyncio
+from collections import deque
 from fractions import Fraction
-from time import time
 import traceback
 from av import AudioFrame
 import numpy as np
@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 
 AUDIO_PTIME = 0.02
+AUDIO_BUFFER_FRAMES = 50
 
 
 class MediaStreamError(Exception):
@@ -21,10 +22,8 @@ class CustomAudioStreamTrack(CustomAudioTrack):
     def __init__(self, loop):
         super().__init__()
         self.loop = loop
-        self._start = None
-        self._timestamp = 0
-        self.frame_buffer = []
-        self.audio_data_buffer = bytearray()
+        self._next_send_time = None
+        self.frame_buffer = deque()
         self.frame_time = 0
         self.sample_rate = 24000
         self.channels = 1
@@ -32,33 +31,79 @@ class CustomAudioStreamTrack(CustomAudioTrack):
         self.time_base_fraction = Fraction(1, self.sample_rate)
         self.samples = int(AUDIO_PTIME * self.sample_rate)
         self.chunk_size = int(self.samples * self.channels * self.sample_width)
+        self.audio_data_buffer = bytearray(self.chunk_size * AUDIO_BUFFER_FRAMES)
+        self._audio_view = memoryview(self.audio_data_buffer)
+        self._read_pos = 0
+        self._write_pos = 0
+        self._is_mono = self.channels == 1
+        self._layout = "mono" if self._is_mono else "stereo"
+        self._silence_bytes = bytes(self.chunk_size)
+        self._silence_frame = AudioFrame(format="s16", layout="mono", samples=self.samples)
+        for p in self._silence_frame.planes:
+            p.update(self._silence_bytes if p.buffer_size == self.chunk_size else bytes(p.buffer_size))
+        # Mono s16 PCM is already in AudioFrame's plane layout, so chunks can be
+        # copied straight into the plane when PyAV does not pad it.
+        self._raw_plane_copy = self._is_mono and self._silence_frame.planes[0].buffer_size == self.chunk_size
+        # from_ndarray copies into the frame's planes, so one aligned, writable
+        # scratch array can be reused for every frame built on the NumPy path.
+        self._scratch = np.empty((1, self.samples), dtype=np.int16)
 
     def interrupt(self):
         self.frame_buffer.clear()
-        self.audio_data_buffer.clear()
-            
-    async def add_new_bytes(self, audio_data: bytes):
-        global_event_emitter.emit("ON_SPEECH_OUT", {"audio_data": audio_data})
-        self.audio_data_buffer += audio_data
-
-        while len(self.audio_data_buffer) >= self.chunk_size:
-            chunk = self.audio_data_buffer[: self.chunk_size]
-            self.audio_data_buffer = self.audio_data_buffer[self.chunk_size :]
+        self._read_pos = 0
+        self._write_pos = 0
+
+    def _write_audio(self, audio_data: memoryview) -> int:
+        """Copies as much of audio_data as fits into the fixed buffer and returns the byte count."""
+        if self._write_pos + len(audio_data) > len(self.audio_data_buffer) and self._read_pos:
+            pending = self._write_pos - self._read_pos
+            self._audio_view[:pending] = self._audio_view[self._read_pos:self._write_pos]
+            self._read_pos = 0
+            self._write_pos = pending
+        size = min(len(audio_data), len(self.audio_data_buffer) - self._write_pos)
+        self._audio_view[self._write_pos:self._write_pos + size] = audio_data[:size]
+        self._write_pos += size
+        return size
+
+    def _drain_audio(self):
+        chunk_size = self.chunk_size
+        start = self._read_pos
+        drained = (self._write_pos - start) // chunk_size * chunk_size
+        pending = self._audio_view[start:start + drained]
+        self._read_pos = start + drained
+        append = self.frame_buffer.append
+        build = self.buildAudioFrames
+        for offset in range(0, drained, chunk_size):
             try:
-                audio_frame = self.buildAudioFrames(chunk)
-                self.frame_buffer.append(audio_frame)
-                logger.debug(
-                    f"Added audio frame to buffer, total frames: {len(self.frame_buffer)}"
-                )
+                append(build(pending[offset:offset + chunk_size]))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added audio frame to buffer, total frames: %d", len(self.frame_buffer))
             except Exception as e:
                 logger.error(f"Error building audio frame: {e}")
+                self._read_pos = start + offset + chunk_size
                 break
 
+        if self._read_pos == self._write_pos:
+            self._read_pos = 0
+            self._write_pos = 0
+            
+    async def add_new_bytes(self, audio_data: bytes):
+        global_event_emitter.emit("ON_SPEECH_OUT", {"audio_data": audio_data})
+        audio_view = memoryview(audio_data).cast("B")
+        offset = 0
+        while offset < len(audio_view):
+            offset += self._write_audio(audio_view[offset:])
+            self._drain_audio()
+
     def buildAudioFrames(self, chunk: bytes) -> AudioFrame:
         if len(chunk) != self.chunk_size:
             logger.warning(
                 f"Incorrect chunk size received {len(chunk)}, expected {self.chunk_size}"
             )
+        elif self._raw_plane_copy:
+            audio_frame = AudioFrame(format="s16", layout="mono", samples=self.samples)
+            audio_frame.planes[0].update(chunk)
+            return audio_frame
 
         data = np.frombuffer(chunk, dtype=np.int16)
         expected_samples = self.samples * self.channels
@@ -67,10 +112,14 @@ class CustomAudioStreamTrack(CustomAudioTrack):
                 f"Incorrect number of samples in chunk {len(data)}, expected {expected_samples}"
             )
 
-        data = data.reshape(-1, self.channels)
-        layout = "mono" if self.channels == 1 else "stereo"
+        if self._is_mono:
+            if len(data) == self.samples:
+                self._scratch[0, :] = data
+                return AudioFrame.from_ndarray(self._scratch, format="s16", layout="mono")
+            return AudioFrame.from_ndarray(data.reshape(1, -1), format="s16", layout="mono")
 
-        audio_frame = AudioFrame.from_ndarray(data.T, format="s16", layout=layout)
+        data = data.reshape(-1, self.channels)
+        audio_frame = AudioFrame.from_ndarray(data.T, format="s16", layout=self._layout)
         return audio_frame
 
     def next_timestamp(self):
@@ -84,13 +133,13 @@ class CustomAudioStreamTrack(CustomAudioTrack):
             if self.readyState != "live":
                 raise MediaStreamError
 
-            if self._start is None:
-                self._start = time()
-                self._timestamp = 0
+            now = self.loop.time()
+            if self._next_send_time is None:
+                self._next_send_time = now
             else:
-                self._timestamp += self.samples
+                self._next_send_time += AUDIO_PTIME
 
-            wait = self._start + (self._timestamp / self.sample_rate) - time()
+            wait = self._next_send_time - now
 
             if wait > 0:
                 await asyncio.sleep(wait)
@@ -98,11 +147,9 @@ class CustomAudioStreamTrack(CustomAudioTrack):
             pts, time_base = self.next_timestamp()
 
             if len(self.frame_buffer) > 0:
-                frame = self.frame_buffer.pop(0)
+                frame = self.frame_buffer.popleft()
             else:
-                frame = AudioFrame(format="s16", layout="mono", samples=self.samples)
-                for p in frame.planes:
-                    p.update(bytes(p.buffer_size))
+                frame = self._silence_frame
 
             frame.pts = pts
             frame.time_base = time_base
@@ -121,15 +168,15 @@ class TeeCustomAudioStreamTrack(CustomAudioStreamTrack):
     def __init__(self, loop, sinks=None, pipeline=None):
         super().__init__(loop)
         self.sinks = sinks if sinks is not None else []
+        self._audio_sinks = [sink for sink in self.sinks if hasattr(sink, "handle_audio_input")]
         self.pipeline = pipeline
 
     async def add_new_bytes(self, audio_data: bytes):
         await super().add_new_bytes(audio_data)
 
         # Route audio to sinks (avatars, etc.)
-        for sink in self.sinks:
-            if hasattr(sink, "handle_audio_input"):
-                await sink.handle_audio_input(audio_data)
+        for sink in self._audio_sinks:
+            await sink.handle_audio_input(audio_data)
 
         # DO NOT route agent's own TTS audio back to pipeline
         # The pipeline should only receive audio from other participants
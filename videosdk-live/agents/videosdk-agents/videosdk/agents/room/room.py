@@ -12,6 +12,7 @@ from .participant_event_handler import ParticipantHandler
 from .audio_stream import TeeCustomAudioStreamTrack
 from videosdk.agents.pipeline import Pipeline
 from dotenv import load_dotenv
+from vsaiortc.mediastreams import MediaStreamError
 import numpy as np
 import asyncio
 import os
@@ -21,7 +22,7 @@ from ..metrics import cascading_metrics_collector
 from ..metrics.integration import auto_initialize_telemetry_and_logs
 from typing import Callable, Optional, Any
 from ..metrics.realtime_metrics_collector import realtime_metrics_collector
-import requests
+import aiohttp
 import time
 import logging
 from ..event_bus import global_event_emitter
@@ -30,10 +31,30 @@ logger = logging.getLogger(__name__)
 START_RECORDING_URL = "https://api.videosdk.live/v2/recordings/participant/start"
 STOP_RECORDING_URL = "https://api.videosdk.live/v2/recordings/participant/stop"
 MERGE_RECORDINGS_URL = "https://api.videosdk.live/v2/recordings/participant/merge"
+AUDIO_QUEUE_MAXSIZE = 32
+AUDIO_DROP_WARN_INTERVAL = 5.0
+AGENT_NAME_MARKERS = ("agent",)
+VIDEO_LISTENER_MAX_FAILURES = 5
 
 load_dotenv()
 
 
+def _pcm_from_frame(frame) -> bytes:
+    """
+    Convert a received audio frame to interleaved int16 PCM bytes.
+    """
+    if frame.format.name == "s16":
+        # Packed s16 planes already hold the interleaved PCM bytes
+        pcm_size = frame.samples * len(frame.layout.channels) * 2
+        return bytes(memoryview(frame.planes[0])[:pcm_size])
+    audio_data = frame.to_ndarray()[0]
+    if audio_data.dtype != np.int16:
+        audio_data = audio_data.astype(np.int16)
+    elif not audio_data.flags["C_CONTIGUOUS"]:
+        audio_data = np.ascontiguousarray(audio_data)
+    return audio_data.tobytes()
+
+
 class VideoSDKHandler:
     """
     Handles VideoSDK meeting operations and participant management.
@@ -86,8 +107,9 @@ class VideoSDKHandler:
             ValueError: If VIDEOSDK_AUTH_TOKEN is not set in environment or parameters.
         """
         self.meeting_id = meeting_id
-        self.auth_token = auth_token
         self.name = name
+        self._name_cf = name.casefold()
+        self._local_id: Optional[str] = None
         self.agent_participant_id = agent_participant_id
         self.pipeline = pipeline
         self.loop = loop
@@ -109,7 +131,9 @@ class VideoSDKHandler:
         # Participant tracking
         self._non_agent_participant_count = 0
         self._first_participant_event = asyncio.Event()
-        self._participant_joined_events = {}
+        self._participants_cv = asyncio.Condition()
+        self._bg_tasks: set[asyncio.Task] = set()
+        self._is_agent_cache: dict[str, bool] = {}
 
         # Meeting and event handling
         self.meeting = None
@@ -122,6 +146,8 @@ class VideoSDKHandler:
         self._session_id: Optional[str] = None
         self._session_id_collected = False
         self.recording = recording
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._local_recording_channel: Optional[list] = None
 
         self.traces_flow_manager = TracesFlowManager(room_id=self.meeting_id)
         cascading_metrics_collector.set_traces_flow_manager(
@@ -144,6 +170,8 @@ class VideoSDKHandler:
         self.auth_token = auth_token or os.getenv("VIDEOSDK_AUTH_TOKEN")
         if not self.auth_token:
             raise ValueError("VIDEOSDK_AUTH_TOKEN is not set")
+        self._rec_headers = {"Authorization": self.auth_token,
+                             "Content-Type": "application/json"}
 
         # Create meeting config as a dictionary instead of using MeetingConfig
         self.meeting_config = {
@@ -161,10 +189,7 @@ class VideoSDKHandler:
 
         self.attributes = {}
         self.on_room_error = on_room_error
-        self._participant_joined_events: dict[str, asyncio.Event] = {}
         self._left: bool = False
-        # Session management
-        self.auto_end_session = auto_end_session
 
     def init_meeting(self):
         """
@@ -219,6 +244,15 @@ class VideoSDKHandler:
         
         await self.cleanup()
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """
+        Internal method: Schedule a fire-and-forget coroutine, keeping a reference until it finishes.
+        """
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
     def on_error(self, data):
         """
         Handle room errors.
@@ -241,10 +275,12 @@ class VideoSDKHandler:
         """
         logger.info(f"Agent joined the meeting")
         self._meeting_joined_data = data
-        asyncio.create_task(self._collect_session_id())
-        asyncio.create_task(self._collect_meeting_attributes())
+        self._local_id = self.meeting.local_participant.id
+        self._local_recording_channel = [{"participantId": self.meeting.local_participant.id}]
+        self._spawn(self._collect_session_id())
+        self._spawn(self._collect_meeting_attributes())
         if self.recording:
-            asyncio.create_task(
+            self._spawn(
                 self.start_participant_recording(
                     self.meeting.local_participant.id)
             )
@@ -259,7 +295,7 @@ class VideoSDKHandler:
         logger.info(f"Meeting Left: {data}")
         self._cancel_session_end_task()
         
-        if hasattr(self, 'participants_data') and self.participants_data:
+        if self.participants_data:
             self.participants_data.clear()
         
         self._session_ended = True
@@ -268,28 +304,34 @@ class VideoSDKHandler:
         """
         Internal method: Check if a participant is an agent.
         """
+        is_agent = self._is_agent_cache.get(participant.id)
+        if is_agent is not None:
+            return is_agent
+
+        local_id = self._local_id
+        if local_id is None:
+            if not (self.meeting and self.meeting.local_participant):
+                return False
+            local_id = self._local_id = self.meeting.local_participant.id
+
         # Consider participants with names containing 'agent' or matching our agent name as agents
-        participant_name = participant.display_name.lower()
-        return (
-            "agent" in participant_name
-            or participant_name == self.name.lower()
-            or participant.id == self.meeting.local_participant.id
-            if self.meeting and self.meeting.local_participant
-            else False
+        participant_name = participant.display_name.casefold()
+        is_agent = (
+            participant.id == local_id
+            or participant_name == self._name_cf
+            or any(marker in participant_name for marker in AGENT_NAME_MARKERS)
         )
+        self._is_agent_cache[participant.id] = is_agent
+        return is_agent
 
-    def _update_non_agent_participant_count(self):
+    def _update_non_agent_participant_count(self, participant: Participant, delta: int):
         """
-        Internal method: Update the count of non-agent participants.
+        Internal method: Apply a join (+1) or leave (-1) to the count of non-agent participants.
         """
-        if not self.meeting:
+        if not self.meeting or self._is_agent_participant(participant):
             return
 
-        count = 0
-        for participant in self.meeting.participants.values():
-            if not self._is_agent_participant(participant):
-                count += 1
-
+        count = max(0, self._non_agent_participant_count + delta)
         self._non_agent_participant_count = count
         logger.debug(f"Non-agent participant count: {count}")
 
@@ -381,21 +423,22 @@ class VideoSDKHandler:
             participant (Participant): The participant that joined.
         """
         peer_name = participant.display_name
+        is_new_participant = participant.id not in self.participants_data
         self.participants_data[participant.id] = {"name": peer_name}
         logger.info(f"Participant joined: {peer_name}")
 
         if self.recording and len(self.participants_data) == 1:
-            asyncio.create_task(
+            self._spawn(
                 self.start_participant_recording(participant.id))
 
-        if participant.id in self._participant_joined_events:
-            self._participant_joined_events[participant.id].set()
+        self._spawn(self._notify_participant_joined())
 
         if not self._first_participant_event.is_set():
             self._first_participant_event.set()
 
         # Update participant count and cancel session end if participants are present
-        self._update_non_agent_participant_count()
+        if is_new_participant:
+            self._update_non_agent_participant_count(participant, 1)
         if self._non_agent_participant_count > 0:
             self._cancel_session_end_task()
 
@@ -465,14 +508,15 @@ class VideoSDKHandler:
             except Exception as e:
                 logger.error(f"Error cancelling video listener task for participant {participant.id}: {e}")
         
-        if participant.id in self.participants_data:
-            del self.participants_data[participant.id]
+        was_present = self.participants_data.pop(participant.id, None) is not None
         
         global_event_emitter.emit(
             "PARTICIPANT_LEFT", {"participant": participant})
 
         # Update participant count and check if session should end
-        self._update_non_agent_participant_count()
+        if was_present:
+            self._update_non_agent_participant_count(participant, -1)
+        self._is_agent_cache.pop(participant.id, None)
         
         if self._non_agent_participant_count == 0 and self.auto_end_session:
             if self.session_timeout_seconds is not None and self.session_timeout_seconds > 0:
@@ -481,44 +525,86 @@ class VideoSDKHandler:
                 self._schedule_session_end(self.session_timeout_seconds)
             else:
                 logger.info("All non-agent participants have left, ending session immediately")
-                asyncio.create_task(self._end_session("all_participants_left"))
+                self._spawn(self._end_session("all_participants_left"))
 
     async def add_audio_listener(self, stream: Stream):
         """
         Add audio listener for a participant stream.
         """
+        audio_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=AUDIO_QUEUE_MAXSIZE)
+        consumer = asyncio.create_task(self._consume_audio(audio_queue))
+        dropped = 0
+        last_drop_warning = 0.0
+        try:
+            while True:
+                try:
+                    frame = await stream.track.recv()
+                    if global_event_emitter.has_listeners("ON_SPEECH_IN"):
+                        global_event_emitter.emit("ON_SPEECH_IN", {"frame": frame, "stream": stream})
+                    pcm_frame = _pcm_from_frame(frame)
+                    if audio_queue.full():
+                        # Drop the oldest frame so a slow pipeline never stalls recv()
+                        audio_queue.get_nowait()
+                        dropped += 1
+                        now = time.monotonic()
+                        if now - last_drop_warning >= AUDIO_DROP_WARN_INTERVAL:
+                            logger.warning(
+                                "Audio pipeline is falling behind on stream %s, dropped %d frames so far",
+                                stream.id,
+                                dropped,
+                            )
+                            last_drop_warning = now
+                    audio_queue.put_nowait(pcm_frame)
+
+                except Exception as e:
+                    logger.error(f"Audio processing error: {e}")
+                    break
+        finally:
+            consumer.cancel()
+
+    async def _consume_audio(self, audio_queue: asyncio.Queue):
+        """
+        Internal method: Forward queued PCM frames from an audio listener to the pipeline.
+        """
         while True:
+            pcm_frame = await audio_queue.get()
             try:
-                await asyncio.sleep(0.01)
-                frame = await stream.track.recv()
-                global_event_emitter.emit("ON_SPEECH_IN", {"frame": frame, "stream": stream})
-                audio_data = frame.to_ndarray()[0]
-                pcm_frame = audio_data.flatten().astype(np.int16).tobytes()
                 if self.pipeline:
                     await self.pipeline.on_audio_delta(pcm_frame)
                 else:
                     logger.warning(
                         "No pipeline available for audio processing")
-
             except Exception as e:
                 logger.error(f"Audio processing error: {e}")
-                break
 
     async def add_video_listener(self, stream: Stream):
         """
         Add video listener for a participant stream.
         """
+        failures = 0
         while True:
             try:
-                await asyncio.sleep(0.01)
-
                 frame = await stream.track.recv()
                 if self.pipeline:
                     await self.pipeline.on_video_delta(frame)
+                failures = 0
 
-            except Exception as e:
-                logger.error("Video processing error:", e)
+            except MediaStreamError:
+                # The track has ended; nothing left to receive
                 break
+            except Exception:
+                failures += 1
+                logger.exception("Video processing error")
+                if failures >= VIDEO_LISTENER_MAX_FAILURES:
+                    break
+                await asyncio.sleep(min(0.05 * 2 ** (failures - 1), 1.0))
+
+    async def _notify_participant_joined(self):
+        """
+        Internal method: Wake wait_for_participant callers to re-check participants_data.
+        """
+        async with self._participants_cv:
+            self._participants_cv.notify_all()
 
     async def wait_for_participant(self, participant_id: str | None = None) -> str:
         """
@@ -534,11 +620,10 @@ class VideoSDKHandler:
             if participant_id in self.participants_data:
                 return participant_id
 
-            if participant_id not in self._participant_joined_events:
-                self._participant_joined_events[participant_id] = asyncio.Event(
+            async with self._participants_cv:
+                await self._participants_cv.wait_for(
+                    lambda: participant_id in self.participants_data
                 )
-
-            await self._participant_joined_events[participant_id].wait()
             return participant_id
         else:
             if self.participants_data:
@@ -602,53 +687,47 @@ class VideoSDKHandler:
         
         self._cancel_session_end_task()
         
-        for task_id, task in list(self.audio_listener_tasks.items()):
-            try:
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            except Exception as e:
-                logger.error(f"Error cancelling audio listener task {task_id}: {e}")
-        self.audio_listener_tasks.clear()
-        
-        for task_id, task in list(self.video_listener_tasks.items()):
-            try:
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            except Exception as e:
-                logger.error(f"Error cancelling video listener task {task_id}: {e}")
-        self.video_listener_tasks.clear()
+        for kind, listener_tasks in (("audio", self.audio_listener_tasks), ("video", self.video_listener_tasks)):
+            tasks = [task for task in listener_tasks.values() if not task.done()]
+            for task in tasks:
+                task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error cancelling {kind} listener task: {result}")
+            listener_tasks.clear()
         
-        if hasattr(self, "audio_track") and self.audio_track:
+        if self.audio_track is not None:
             try:
                 await self.audio_track.cleanup()
             except Exception as e:
                 logger.error(f"Error cleaning up audio track: {e}")
             self.audio_track = None
             
-        if hasattr(self, "agent_audio_track") and self.agent_audio_track:
+        if self.agent_audio_track is not None:
             try:
                 await self.agent_audio_track.cleanup()
             except Exception as e:
                 logger.error(f"Error cleaning up agent audio track: {e}")
             self.agent_audio_track = None
         
-        if hasattr(self, "traces_flow_manager") and self.traces_flow_manager:
+        if self.traces_flow_manager is not None:
             try:
                 self.traces_flow_manager.agent_meeting_end()
             except Exception as e:
                 logger.error(f"Error ending traces flow manager: {e}")
             self.traces_flow_manager = None
+
+        if self._http is not None:
+            try:
+                await self._http.close()
+            except Exception as e:
+                logger.error(f"Error closing recording HTTP session: {e}")
+            self._http = None
         
         self.participants_data.clear()
-        self._participant_joined_events.clear()
+        self._is_agent_cache.clear()
+        self._local_id = None
         self.meeting = None
         self.pipeline = None
         self.custom_camera_video_track = None
@@ -725,15 +804,27 @@ class VideoSDKHandler:
             logger.error(
                 f"Error collecting meeting attributes and creating spans: {e}")
 
+    def _http_session(self) -> aiohttp.ClientSession:
+        """
+        Internal method: Get the shared HTTP session for recording requests, creating it on first use.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(headers=self._rec_headers)
+        return self._http
+
     async def stop_participants_recording(self):
         """
         Stop recording for all participants.
         """
-        await self.stop_participant_recording(self.meeting.local_participant.id)
-        for participant_id in self.participants_data.keys():
-            logger.info("stopping participant recording for id",
-                        participant_id)
-            await self.stop_participant_recording(participant_id)
+        participant_ids = [self.meeting.local_participant.id, *self.participants_data.keys()]
+        logger.info(f"stopping participant recordings for ids {participant_ids}")
+        results = await asyncio.gather(
+            *(self.stop_participant_recording(participant_id) for participant_id in participant_ids),
+            return_exceptions=True,
+        )
+        for participant_id, result in zip(participant_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping recording for participant {participant_id}: {result}")
 
     async def start_participant_recording(self, id: str):
         """
@@ -742,15 +833,12 @@ class VideoSDKHandler:
         Args:
             id (str): Participant ID to start recording for.
         """
-        headers = {"Authorization": self.auth_token,
-                   "Content-Type": "application/json"}
-        response = requests.request(
-            "POST",
+        async with self._http_session().post(
             START_RECORDING_URL,
             json={"roomId": self.meeting_id, "participantId": id},
-            headers=headers,
-        )
-        logger.info(f"starting participant recording response completed for id {id} and response{response.text}")
+        ) as response:
+            text = await response.text()
+        logger.info(f"starting participant recording response completed for id {id} and response{text}")
 
     async def stop_participant_recording(self, id: str):
         """
@@ -759,36 +847,31 @@ class VideoSDKHandler:
         Args:
             id (str): Participant ID to stop recording for.
         """
-        headers = {"Authorization": self.auth_token,
-                   "Content-Type": "application/json"}
-        response = requests.request(
-            "POST",
+        async with self._http_session().post(
             STOP_RECORDING_URL,
             json={"roomId": self.meeting_id, "participantId": id},
-            headers=headers,
-        )
-        logger.info(f"stop participant recording response for id {id} and response{response.text}")
+        ) as response:
+            text = await response.text()
+        logger.info(f"stop participant recording response for id {id} and response{text}")
 
     async def merge_participant_recordings(self):
         """
         Merge recordings from all participants.
         """
-        headers = {"Authorization": self.auth_token,
-                   "Content-Type": "application/json"}
-        response = requests.request(
-            "POST",
+        async with self._http_session().post(
             MERGE_RECORDINGS_URL,
             json={
                 "sessionId": self.meeting.session_id,
-                "channel1": [{"participantId": self.meeting.local_participant.id}],
+                "channel1": self._local_recording_channel
+                or [{"participantId": self.meeting.local_participant.id}],
                 "channel2": [
                     {"participantId": participant_id}
                     for participant_id in self.participants_data.keys()
                 ],
             },
-            headers=headers,
-        )
-        logger.info(f"merging participant recordings completed response:{response.text}" )
+        ) as response:
+            text = await response.text()
+        logger.info(f"merging participant recordings completed response:{text}" )
 
     async def stop_and_merge_recordings(self):
         """
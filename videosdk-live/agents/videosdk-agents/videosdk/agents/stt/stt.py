@@ -90,13 +90,6 @@ class STT(EventEmitter[Literal["error"]]):
         """Cleanup resources"""
         logger.info(f"Cleaning up STT: {self.label}")
         self._transcript_callback = None
-        try:
-            import gc
-            gc.collect()
-            logger.info(f"STT garbage collection completed: {self.label}")
-        except Exception as e:
-            logger.error(f"Error during STT garbage collection: {e}")
-        
         logger.info(f"STT cleanup completed: {self.label}")
     
     async def __aenter__(self) -> STT:
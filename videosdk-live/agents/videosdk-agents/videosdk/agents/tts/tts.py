@@ -73,12 +73,6 @@ class TTS(EventEmitter[Literal["error"]]):
         """Cleanup resources"""
         logger.info(f"Cleaning up TTS: {self.label}")
         self._first_audio_callback = None
-        try:
-            import gc
-            gc.collect()
-        except Exception as e:
-            logger.error(f"Error during TTS garbage collection: {e}")
-        
         logger.info(f"TTS cleanup completed: {self.label}")
     
     async def __aenter__(self) -> TTS:
@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 import enum
 from typing import Any, Protocol, runtime_checkable, Callable, Optional, get_type_hints, Annotated, get_origin, get_args, Literal, AsyncIterator
-from functools import wraps
 import inspect
 from docstring_parser import parse_from_object
 from google.genai import types
@@ -13,6 +12,17 @@ from pydantic.fields import FieldInfo
 from abc import abstractmethod
 import json
 import asyncio
+import re
+import weakref
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except Exception:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 @dataclass
 class FunctionToolInfo:
@@ -44,18 +54,18 @@ class FunctionTool(Protocol):
 
 def is_function_tool(obj: Any) -> bool:
     """Check if an object is a function tool"""
-    if inspect.ismethod(obj):
-        obj = obj.__func__
-    return hasattr(obj, "_tool_info")
+    try:
+        (obj.__func__ if inspect.ismethod(obj) else obj)._tool_info
+    except AttributeError:
+        return False
+    return True
 
 def get_tool_info(tool: FunctionTool) -> FunctionToolInfo:
     """Get the tool info from a function tool"""
-    if not is_function_tool(tool):
-        raise ValueError("Object is not a function tool")
-    
-    if inspect.ismethod(tool):
-        tool = tool.__func__
-    return getattr(tool, "_tool_info")
+    try:
+        return (tool.__func__ if inspect.ismethod(tool) else tool)._tool_info
+    except AttributeError:
+        raise ValueError("Object is not a function tool") from None
 
 def function_tool(func: Optional[Callable] = None, *, name: Optional[str] = None):
     """Decorator to mark a function as a tool. Can be used with or without parentheses."""
@@ -66,122 +76,95 @@ def function_tool(func: Optional[Callable] = None, *, name: Optional[str] = None
             description=fn.__doc__
         )
         
-        if asyncio.iscoroutinefunction(fn):
-            @wraps(fn)
-            async def async_wrapper(*args, **kwargs):
-                return await fn(*args, **kwargs)
-            
-            setattr(async_wrapper, "_tool_info", tool_info)
-            return async_wrapper
-        else:
-            @wraps(fn)
-            def sync_wrapper(*args, **kwargs):
-                return fn(*args, **kwargs)
-            
-            setattr(sync_wrapper, "_tool_info", tool_info)
-            return sync_wrapper
+        # The tool info is attached to fn itself; a pass-through wrapper would only add a call frame
+        setattr(fn, "_tool_info", tool_info)
+        return fn
     
     if func is None:
         return create_wrapper
     
     return create_wrapper(func)
 
+_ARGS_MODEL_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], type[BaseModel]] = weakref.WeakKeyDictionary()
+
 def build_pydantic_args_model(func: Callable[..., Any]) -> type[BaseModel]:
     """
     Dynamically construct a Pydantic BaseModel class representing all
     valid positional arguments of the given function, complete with types,
     default values, and docstring descriptions.
-    """
-    return ModelBuilder(func).construct()
-
-class ModelBuilder:
-    def __init__(self, func: Callable[..., Any]):
-        self.func = func
-        self.sig = inspect.signature(func)
-        self.hints = get_type_hints(func, include_extras=True)
-        self.docs = parse_from_object(func)
-        self._field_registry = {}
-    
-    def construct(self) -> type[BaseModel]:
-        self._register_all_fields()
-        return create_model(self._generate_class_name(), **self._field_registry)
-    
-    def _register_all_fields(self) -> None:
-        for name, param in self.sig.parameters.items():
-            if self._should_skip_param(name):
-                continue
-            self._register_field(name, param)
-    
-    def _should_skip_param(self, name: str) -> bool:
-        return name in ("self", "cls") or name not in self.hints
-    
-    def _register_field(self, name: str, param: inspect.Parameter) -> None:
-        type_info = TypeProcessor(self.hints[name])
-        field_builder = FieldBuilder(param, type_info, self._find_doc_description(name))
-        self._field_registry[name] = field_builder.build()
-    
-    def _find_doc_description(self, param_name: str) -> str | None:
-        return next(
-            (p.description for p in self.docs.params if p.arg_name == param_name),
-            None
-        )
-    
-    def _generate_class_name(self) -> str:
-        return "".join(part.title() for part in self.func.__name__.split("_")) + "Args"
-
-class TypeProcessor:
-    def __init__(self, hint: Any):
-        self.original_hint = hint
-        self.base_type = hint
-        self.field_info = Field()
-        self._process_annotation()
-    
-    def _process_annotation(self) -> None:
-        if get_origin(self.original_hint) is Annotated:
-            args = get_args(self.original_hint)
-            self.base_type = args[0]
-            self._extract_field_info_from_args(args[1:])
-    
-    def _extract_field_info_from_args(self, args: tuple) -> None:
-        for arg in args:
-            if isinstance(arg, FieldInfo):
-                self.field_info = arg
-                break
 
-class FieldBuilder:
-    def __init__(self, param: inspect.Parameter, type_processor: TypeProcessor, description: str | None):
-        self.param = param
-        self.type_processor = type_processor
-        self.description = description
-    
-    def build(self) -> tuple[Any, FieldInfo]:
-        field_info = self.type_processor.field_info
-        self._apply_default_if_needed(field_info)
-        self._apply_description_if_needed(field_info)
-        return (self.type_processor.base_type, field_info)
-    
-    def _apply_default_if_needed(self, field_info: FieldInfo) -> None:
-        if (self.param.default is not inspect.Parameter.empty and 
-            field_info.default is PydanticUndefined):
-            field_info.default = self.param.default
-    
-    def _apply_description_if_needed(self, field_info: FieldInfo) -> None:
-        if field_info.description is None and self.description is not None:
-            field_info.description = self.description
+    Models are cached per underlying function, so bound methods of different
+    instances share one model.
+    """
+    if inspect.ismethod(func):
+        func = func.__func__
+    model = _ARGS_MODEL_CACHE.get(func)
+    if model is None:
+        model = _ARGS_MODEL_CACHE[func] = _construct_args_model(func)
+    return model
+
+def _construct_args_model(func: Callable[..., Any]) -> type[BaseModel]:
+    sig = inspect.signature(func)
+    hints = get_type_hints(func, include_extras=True)
+    descriptions: dict[str, str | None] = {}
+    for doc_param in parse_from_object(func).params:
+        descriptions.setdefault(doc_param.arg_name, doc_param.description)
+    fields: dict[str, tuple[Any, FieldInfo]] = {}
+
+    for name, param in sig.parameters.items():
+        if name in ("self", "cls") or name not in hints:
+            continue
+        hint = hints[name]
+        field_info = None
+        if get_origin(hint) is Annotated:
+            hint, *extras = get_args(hint)
+            field_info = next((arg for arg in extras if isinstance(arg, FieldInfo)), None)
+        if field_info is None:
+            field_info = Field()
+
+        if param.default is not inspect.Parameter.empty and field_info.default is PydanticUndefined:
+            field_info.default = param.default
+        description = descriptions.get(name)
+        if field_info.description is None and description is not None:
+            field_info.description = description
+        fields[name] = (hint, field_info)
+
+    class_name = "".join(part.title() for part in func.__name__.split("_")) + "Args"
+    return create_model(class_name, **fields)
+
+_ARGS_SCHEMA_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = weakref.WeakKeyDictionary()
+_DERIVED_SCHEMA_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, tuple[Any, Any]]] = weakref.WeakKeyDictionary()
+
+def _args_json_schema(function_tool: FunctionTool) -> dict[str, Any]:
+    """JSON schema of the tool's argument model, generated once per function."""
+    func = function_tool.__func__ if inspect.ismethod(function_tool) else function_tool
+    schema = _ARGS_SCHEMA_CACHE.get(func)
+    if schema is None:
+        schema = _ARGS_SCHEMA_CACHE[func] = build_pydantic_args_model(func).model_json_schema()
+    return schema
+
+def _params_json_schema(function_tool: FunctionTool, tool_info: FunctionToolInfo) -> dict[str, Any]:
+    if tool_info.parameters_schema is not None:
+        return tool_info.parameters_schema
+    return _args_json_schema(function_tool)
+
+def _derived_schema(function_tool: FunctionTool, kind: str, source: Any, build: Callable[[Any], Any]) -> Any:
+    """Cache a value derived from a tool's parameter schema until that schema object is replaced."""
+    func = function_tool.__func__ if inspect.ismethod(function_tool) else function_tool
+    entries = _DERIVED_SCHEMA_CACHE.get(func)
+    if entries is None:
+        entries = _DERIVED_SCHEMA_CACHE[func] = {}
+    cached = entries.get(kind)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+    value = build(source)
+    entries[kind] = (source, value)
+    return value
 
 def build_openai_schema(function_tool: FunctionTool) -> dict[str, Any]:
     """Build OpenAI-compatible schema from a function tool"""
     tool_info = get_tool_info(function_tool)
-    
-    params_schema_to_use: Optional[dict] = None
-
-    if tool_info.parameters_schema is not None:
-        params_schema_to_use = tool_info.parameters_schema
-    else:
-        model = build_pydantic_args_model(function_tool)
-        params_schema_to_use = model.model_json_schema()
-
-    final_params_schema = params_schema_to_use if params_schema_to_use is not None else {"type": "object", "properties": {}}
+    final_params_schema = _params_json_schema(function_tool, tool_info)
 
     return {
             "name": tool_info.name,
@@ -191,57 +174,51 @@ def build_openai_schema(function_tool: FunctionTool) -> dict[str, Any]:
     }
         
 
+_GEMINI_TYPE_MAPPING: dict[str, types.Type] = {
+    "string": types.Type.STRING,
+    "number": types.Type.NUMBER,
+    "integer": types.Type.INTEGER,
+    "boolean": types.Type.BOOLEAN,
+    "array": types.Type.ARRAY,
+    "object": types.Type.OBJECT,
+}
+_GEMINI_FIELDS_TO_REMOVE = frozenset(("title", "default", "additionalProperties", "$defs"))
+
+def _simplify_gemini_node(node: dict[str, Any]) -> dict[str, Any] | None:
+    new_node = {k: v for k, v in node.items() if k not in _GEMINI_FIELDS_TO_REMOVE}
+
+    node_type = new_node.get("type")
+    mapped_type = _GEMINI_TYPE_MAPPING.get(node_type) if isinstance(node_type, str) else None
+    if mapped_type is not None:
+        new_node["type"] = node_type = mapped_type
+
+    if node_type == types.Type.OBJECT:
+        properties = new_node.get("properties")
+        if properties is None:
+            return None
+        new_props = {
+            key: simplified
+            for key, prop in properties.items()
+            if (simplified := _simplify_gemini_node(prop)) is not None
+        }
+        if not new_props:
+            return None
+        new_node["properties"] = new_props
+    elif node_type == types.Type.ARRAY:
+        if "items" in new_node:
+            simplified_items = _simplify_gemini_node(new_node["items"])
+            if simplified_items is not None:
+                new_node["items"] = simplified_items
+            else:
+                del new_node["items"]
+
+    return new_node
+
 def simplify_gemini_schema(schema: dict[str, Any]) -> dict[str, Any] | None:
     """
     Transforms a JSON Schema into Gemini compatible format.
     """
-
-    TYPE_MAPPING: dict[str, types.Type] = {
-        "string": types.Type.STRING,
-        "number": types.Type.NUMBER,
-        "integer": types.Type.INTEGER,
-        "boolean": types.Type.BOOLEAN,
-        "array": types.Type.ARRAY,
-        "object": types.Type.OBJECT,
-    }
-
-    SUPPORTED_TYPES = set(TYPE_MAPPING.keys())
-    FIELDS_TO_REMOVE = ("title", "default", "additionalProperties", "$defs")
-
-    def process_node(node: dict[str, Any]) -> dict[str, Any] | None:
-        new_node = node.copy()
-        for field in FIELDS_TO_REMOVE:
-            if field in new_node:
-                del new_node[field]
-
-        json_type = new_node.get("type")
-        if json_type in SUPPORTED_TYPES:
-            new_node["type"] = TYPE_MAPPING[json_type]
-
-        node_type = new_node.get("type")
-        if node_type == types.Type.OBJECT:
-            if "properties" in new_node:
-                new_props = {}
-                for key, prop in new_node["properties"].items():
-                    simplified = process_node(prop)
-                    if simplified is not None:
-                        new_props[key] = simplified
-                new_node["properties"] = new_props
-                if not new_props:
-                    return None
-            else:
-                return None
-        elif node_type == types.Type.ARRAY:
-            if "items" in new_node:
-                simplified_items = process_node(new_node["items"])
-                if simplified_items is not None:
-                    new_node["items"] = simplified_items
-                else:
-                    del new_node["items"]
-
-        return new_node
-
-    result = process_node(schema)
+    result = _simplify_gemini_node(schema)
     if result and result.get("type") == types.Type.OBJECT and not result.get("properties"):
         return None
     return result
@@ -252,16 +229,11 @@ def build_gemini_schema(function_tool: FunctionTool) -> types.FunctionDeclaratio
     
     parameter_json_schema_for_gemini: Optional[dict[str, Any]] = None
 
-    if tool_info.parameters_schema is not None:
-         if tool_info.parameters_schema and tool_info.parameters_schema.get("properties", True) is not None:
-            simplified_schema = simplify_gemini_schema(tool_info.parameters_schema)
-            parameter_json_schema_for_gemini = simplified_schema
-    else:
-        openai_schema = build_openai_schema(function_tool) 
-
-        if openai_schema.get("parameters") and openai_schema["parameters"].get("properties", True) is not None:
-             simplified_schema = simplify_gemini_schema(openai_schema["parameters"])
-             parameter_json_schema_for_gemini = simplified_schema
+    params_schema = _params_json_schema(function_tool, tool_info)
+    if params_schema and params_schema.get("properties", True) is not None:
+        parameter_json_schema_for_gemini = _derived_schema(
+            function_tool, "gemini", params_schema, simplify_gemini_schema
+        )
 
     func_declaration = types.FunctionDeclaration(
         name=tool_info.name, 
@@ -278,7 +250,7 @@ def build_mcp_schema(function_tool: FunctionTool) -> dict:
     return {
         "name": tool_info.name,
         "description": tool_info.description,
-        "parameters": build_pydantic_args_model(function_tool).model_json_schema()
+        "parameters": _args_json_schema(function_tool)
     }
 
 class ToolError(Exception):
@@ -329,26 +301,27 @@ def create_generic_mcp_adapter(
         tool_info_no_param.parameters_schema = input_schema
         return no_param_tool
     else:
+        required_set = frozenset(required_params)
+        requires_instructions = 'instructions' in required_set
+        param_help_map = {
+            param: f"'{param}': {param_properties.get(param, {}).get('description', f'Parameter for {tool_name}')}"
+            for param in required_params
+        }
+
         @function_tool(name=tool_name) 
         async def param_tool(**kwargs) -> Any:
-            actual_kwargs = kwargs.copy() # Work with a copy
+            actual_kwargs = kwargs
 
-            if 'instructions' in required_params and 'instructions' not in actual_kwargs:
+            if requires_instructions and 'instructions' not in actual_kwargs:
                 other_params_provided = any(p in actual_kwargs for p in param_properties if p != 'instructions')
                 if other_params_provided:
-                    actual_kwargs['instructions'] = f"Execute tool {tool_name} with the provided parameters."
+                    actual_kwargs = {**kwargs, 'instructions': f"Execute tool {tool_name} with the provided parameters."}
 
-            
-            missing = [p for p in required_params if p not in actual_kwargs]
-            if missing:
+            if not required_set <= actual_kwargs.keys():
+                # Keep the schema's order of required parameters in the error message
+                missing = [p for p in required_params if p not in actual_kwargs]
                 missing_str = ", ".join(missing)
-                param_details = []
-                for param in missing:
-                    param_info = param_properties.get(param, {})
-                    desc = param_info.get('description', f"Parameter for {tool_name}")
-                    param_details.append(f"'{param}': {desc}")
-                
-                param_help = "; ".join(param_details)
+                param_help = "; ".join(param_help_map[p] for p in missing)
                 raise ToolError(
                     f"Missing required parameters for {tool_name}: {missing_str}. "
                     f"Required parameters: {param_help}"
@@ -363,17 +336,10 @@ def build_nova_sonic_schema(function_tool: FunctionTool) -> dict[str, Any]:
     """Build Amazon Nova Sonic-compatible schema from a function tool"""
     tool_info = get_tool_info(function_tool)
 
-    params_schema_to_use: Optional[dict] = None
-
-    if tool_info.parameters_schema is not None:
-        params_schema_to_use = tool_info.parameters_schema
-    else:
-        model = build_pydantic_args_model(function_tool)
-        params_schema_to_use = model.model_json_schema()
-    
-
-    final_params_schema_for_nova = params_schema_to_use if params_schema_to_use is not None else {"type": "object", "properties": {}}
-    input_schema_json_string = json.dumps(final_params_schema_for_nova)
+    final_params_schema_for_nova = _params_json_schema(function_tool, tool_info)
+    input_schema_json_string = _derived_schema(
+        function_tool, "nova_sonic_json", final_params_schema_for_nova, _json_dumps
+    )
 
     description = tool_info.description or tool_info.name
 
@@ -387,6 +353,16 @@ def build_nova_sonic_schema(function_tool: FunctionTool) -> dict[str, Any]:
         }
     }
 
+_DELIM_RE_CACHE: dict[str, re.Pattern[str]] = {}
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+def _delimiter_pattern(delimiters: str) -> re.Pattern[str]:
+    pattern = _DELIM_RE_CACHE.get(delimiters)
+    if pattern is None:
+        pattern = _DELIM_RE_CACHE[delimiters] = re.compile(f"[{re.escape(delimiters)}]")
+    return pattern
+
 async def segment_text(
     chunks: AsyncIterator[str],
     delimiters: str = ".?!,;:\n",
@@ -400,28 +376,43 @@ async def segment_text(
     Yields segments while keeping the delimiter if requested.
     """
     buffer = ""
-
-    def words_count(s: str) -> int:
-        return len(s.split())
-
-    def find_first_delim_index(s: str) -> int:
-        indices = [i for d in delimiters if (i := s.find(d)) != -1]
-        return min(indices) if indices else -1
+    # buffer[:pos] has already been emitted; everything before scan_start has no delimiter
+    pos = 0
+    scan_start = 0
+    non_space_search = _NON_SPACE_RE.search
+    delim_search = _delimiter_pattern(delimiters).search if delimiters else None
+    max_words = min_words * 2
+    # Below this length a delimiter-free buffer cannot trigger a soft-boundary cut
+    fast_len = min(min_chars, max_buffer, 2 * max_words - 1)
+
+    def words_exceeded(s: str) -> bool:
+        # A word needs at least one character plus a separator, so short buffers can skip split()
+        return (len(s) + 1) // 2 >= max_words and len(s.split()) >= max_words
 
     async for chunk in chunks:
         if not chunk:
             continue
         buffer += chunk
+        if len(buffer) < fast_len and (delim_search is None or delim_search(chunk) is None):
+            scan_start = len(buffer)
+            continue
 
         while True:
-            di = find_first_delim_index(buffer)
-            if di != -1:
-                seg = buffer[: di + (1 if keep_delimiter else 0)]
+            m = delim_search(buffer, scan_start) if delim_search else None
+            if m is not None:
+                di = m.start()
+                seg = buffer[pos: di + (1 if keep_delimiter else 0)]
                 yield seg
-                buffer = buffer[di + 1 :].lstrip()
+                # Advance past the delimiter and following whitespace without re-slicing the buffer
+                ws_end = non_space_search(buffer, di + 1)
+                pos = scan_start = ws_end.start() if ws_end else len(buffer)
                 continue
             else:
-                if len(buffer) >= max_buffer or words_count(buffer) >= (min_words * 2):
+                if pos:
+                    buffer = buffer[pos:]
+                    pos = 0
+                scan_start = len(buffer)
+                if len(buffer) >= max_buffer or words_exceeded(buffer):
                     target = max(min_chars, min(len(buffer), max_buffer))
                     cut_idx = buffer.rfind(" ", 0, target)
                     if cut_idx == -1:
@@ -430,6 +421,7 @@ async def segment_text(
                     if seg:
                         yield seg
                     buffer = buffer[cut_idx:].lstrip()
+                    scan_start = len(buffer)
                     continue
                 break
 
@@ -444,11 +436,9 @@ async def graceful_cancel(*tasks: asyncio.Task) -> None:
     for task in tasks:
         if not task.done():
             task.cancel()
-    
-    try:
-        await asyncio.wait_for(
-            asyncio.gather(*tasks, return_exceptions=True),
-            timeout=0.5
-        )
-    except asyncio.TimeoutError:
-        pass
\ No newline at end of file
+
+    done, _ = await asyncio.wait(tasks, timeout=0.5)
+    for task in done:
+        # Retrieve exceptions so they are not reported as never retrieved
+        if not task.cancelled():
+            task.exception()
\ No newline at end of file
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Any, Awaitable, Callable, Literal, Optional
 from pydantic import BaseModel
 from .event_emitter import EventEmitter
+import asyncio
 import logging
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ class VAD(EventEmitter[Literal["error", "info"]]):
         self._min_speech_duration = min_speech_duration
         self._min_silence_duration = min_silence_duration
         self._vad_callback: Optional[Callable[[VADResponse], Awaitable[None]]] = None
+        self._sync_vad_callback: Callable[[VADResponse], None] | None = None
 
     @property
     def label(self) -> str:
@@ -81,14 +83,8 @@ class VAD(EventEmitter[Literal["error", "info"]]):
         """Cleanup resources"""
         logger.info(f"Cleaning up VAD: {self.label}")
         
-        self._vad_callback = None        
-        try:
-            import gc
-            gc.collect()
-            logger.info(f"VAD garbage collection completed: {self.label}")
-        except Exception as e:
-            logger.error(f"Error during VAD garbage collection: {e}")
-        
+        self._vad_callback = None
+        self._sync_vad_callback = None
         logger.info(f"VAD cleanup completed: {self.label}")
     
     async def __aenter__(self) -> VAD:
@@ -100,3 +96,14 @@ class VAD(EventEmitter[Literal["error", "info"]]):
     def on_vad_event(self, callback: Callable[[VADResponse], Awaitable[None]]) -> None:
         """Set callback for receiving VAD events"""
         self._vad_callback = callback
+
+    def on_vad_event_sync(self, callback: Callable[[VADResponse], None] | None) -> None:
+        """Set a synchronous callback invoked directly for each VAD event, bypassing task scheduling"""
+        self._sync_vad_callback = callback
+
+    def _dispatch_vad_event(self, response: VADResponse) -> None:
+        """Deliver a VAD event to the sync callback if set, otherwise schedule the async callback"""
+        if self._sync_vad_callback is not None:
+            self._sync_vad_callback(response)
+        elif self._vad_callback is not None:
+            asyncio.create_task(self._vad_callback(response))
@@ -1,4 +1,7 @@
 import asyncio
+import inspect
+import json
+import math
 import os
 import sys
 import time
@@ -32,6 +35,13 @@ from .debug import HttpServer, Tracing
 
 logger = logging.getLogger(__name__)
 
+try:
+    import uvloop
+
+    _UVLOOP_AVAILABLE = True
+except Exception:
+    _UVLOOP_AVAILABLE = False
+
 
 # Automatic platform-based defaults
 if sys.platform.startswith("win"):
@@ -40,12 +50,23 @@ if sys.platform.startswith("win"):
 else:
     _default_executor_type = ExecutorType.PROCESS
 
+# Grace period for a signal-initiated shutdown before worker tasks are cancelled
+_SIGNAL_SHUTDOWN_TIMEOUT = 3.0
+
+# Time constant, in seconds, of the job load moving average used in admission control
+_LOAD_EWMA_TAU = 10.0
+
+_EXECUTOR_TO_RESOURCE = {
+    ExecutorType.THREAD: ResourceType.THREAD,
+    ExecutorType.PROCESS: ResourceType.PROCESS,
+}
+
 
 class WorkerType(Enum):
     ROOM = "room"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerPermissions:
     """Permissions for the agent participant."""
 
@@ -56,7 +77,7 @@ class WorkerPermissions:
     hidden: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerOptions:
     """Configuration options for the VideoSDK worker."""
 
@@ -136,7 +157,7 @@ class WorkerOptions:
         logger.info(f"Worker configured with {self.executor_type.value} executor")
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRequest:
     """Job request from the backend."""
 
@@ -162,9 +183,12 @@ class Worker:
         """Initialize the worker."""
         self.options = options
         self.default_room_options = default_room_options
-        self._shutdown = False
+        self._shutdown_evt = asyncio.Event()
         self._draining = False
         self._worker_load = 0.0
+        self._job_count = 0
+        self._load_ewma = 0.0
+        self._load_ewma_ts = time.monotonic()
         self._current_jobs: Dict[str, RunningJobInfo] = {}
         self._tasks: Set[asyncio.Task] = set()
         self.backend_connection: Optional[BackendConnection] = None
@@ -174,10 +198,24 @@ class Worker:
         self._http_server: Optional[HttpServer] = None
 
         # Add debounce mechanism for status updates
-        self._last_status_update = 0.0
         self._status_update_debounce_seconds = (
             2.0  # Minimum 2 seconds between status updates
         )
+        # Event-driven status updates are coalesced by a single pump task
+        self._status_dirty = asyncio.Event()
+        self._status_pump_task: Optional[asyncio.Task] = None
+        self._status_msg: Optional[WorkerMessage] = None
+        # Pre-serialized availability responses, split around the job_id value
+        self._accept_template: Optional[tuple[str, str]] = None
+        self._reject_template: Optional[tuple[str, str]] = None
+        # Backend requests are drained by fixed worker pools from bounded queues
+        queue_size = self.options.max_processes * 4
+        self._availability_queue: asyncio.Queue[AvailabilityRequest] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._assignment_queue: asyncio.Queue[JobAssignment] = asyncio.Queue(
+            maxsize=queue_size
+        )
         # Initialize tracing
         self._tracing = Tracing.with_handle("worker")
         self._worker_load_graph = Tracing.add_graph(
@@ -195,6 +233,11 @@ class Worker:
                 "auth_token is required, or add VIDEOSDK_AUTH_TOKEN in your environment"
             )
 
+    @property
+    def _shutdown(self) -> bool:
+        """Whether shutdown has been requested."""
+        return self._shutdown_evt.is_set()
+
     @staticmethod
     def run_worker(
         options: WorkerOptions, default_room_options: Optional[RoomOptions] = None
@@ -228,7 +271,7 @@ class Worker:
             ```
         """
         worker = Worker(options, default_room_options=default_room_options)
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if _UVLOOP_AVAILABLE else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         async def main_task():
@@ -239,8 +282,7 @@ class Worker:
                     await worker._run_backend_mode()
                 else:
                     # Default mode - just keep alive
-                    while not worker._shutdown:
-                        await asyncio.sleep(1)
+                    await worker._shutdown_evt.wait()
 
             except asyncio.CancelledError:
                 logger.info("Main task cancelled")
@@ -248,7 +290,20 @@ class Worker:
                 logger.error(f"Worker error: {e}")
                 raise
             finally:
-                await worker.shutdown()
+                if shutting_down:
+                    # Signal-initiated shutdown gets a bounded grace period
+                    try:
+                        await asyncio.wait_for(
+                            worker.shutdown(), _SIGNAL_SHUTDOWN_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            f"Graceful shutdown timed out after {_SIGNAL_SHUTDOWN_TIMEOUT}s, cancelling worker tasks"
+                        )
+                        for task in worker._tasks:
+                            task.cancel()
+                else:
+                    await worker.shutdown()
 
         main_future = loop.create_task(main_task())
         shutting_down = False
@@ -256,16 +311,13 @@ class Worker:
         def signal_handler(signum, frame):
             nonlocal shutting_down
             if shutting_down:
-                # If already shutting down, cancel all tasks more aggressively
-                for task in asyncio.all_tasks(loop):
-                    task.cancel()
+                # If already shutting down, abort the graceful shutdown
+                loop.call_soon_threadsafe(main_future.cancel)
                 return
             shutting_down = True
             logger.info(f"Received signal {signum}. Initiating graceful shutdown...")
-            # Cancel the main task
-            loop.call_soon_threadsafe(main_future.cancel)
-            # Set a timeout for graceful shutdown
-            loop.call_later(3.0, lambda: [task.cancel() for task in asyncio.all_tasks(loop)])
+            # Wake the main task, which runs the shutdown with a timeout
+            loop.call_soon_threadsafe(worker._shutdown_evt.set)
 
         try:
             signal.signal(signal.SIGINT, signal_handler)
@@ -293,12 +345,7 @@ class Worker:
         logger.info("Initializing VideoSDK worker")
 
         # Initialize task executor with new execution architecture
-        # Convert ExecutorType to ResourceType
-        resource_type = (
-            ResourceType.THREAD
-            if self.options.executor_type == ExecutorType.THREAD
-            else ResourceType.PROCESS
-        )
+        resource_type = _EXECUTOR_TO_RESOURCE[self.options.executor_type]
 
         config = ResourceConfig(
             resource_type=resource_type,
@@ -324,6 +371,10 @@ class Worker:
         # Initialize backend connection if registering
         if self.options.register:
             await self._initialize_backend_connection()
+            self._status_pump_task = asyncio.create_task(self._status_pump())
+            self._tasks.add(self._status_pump_task)
+            self._request_status_update()
+            self._start_request_workers()
 
         # Initialize and start debug HTTP server
         self._http_server = HttpServer(
@@ -363,6 +414,13 @@ class Worker:
             max_processes=self.options.max_processes,
         )
 
+        self._accept_template = self._availability_template(
+            available=True, token=self.options.auth_token
+        )
+        self._reject_template = self._availability_template(
+            available=False, error="Worker at capacity or draining"
+        )
+
         # Set up message handlers
         self.backend_connection.on_register(self._handle_register)
         self.backend_connection.on_availability(self._handle_availability)
@@ -376,60 +434,93 @@ class Worker:
         """Run the worker in backend registration mode."""
         logger.info("Running in backend registration mode")
 
-        # Start status update loop
-        status_task = asyncio.create_task(self._status_update_loop())
-        self._tasks.add(status_task)
-
-        try:
-            # Keep the worker running
-            while not self._shutdown:
-                await asyncio.sleep(1)
-        finally:
-            status_task.cancel()
-            self._tasks.discard(status_task)
+        # Keep the worker running; periodic status updates come from the status pump
+        await self._shutdown_evt.wait()
 
     def _handle_register(self, worker_id: str, server_info: Dict[str, Any]):
         """Handle registration response from backend."""
         logger.info(f"Registered with backend: {worker_id}")
         logger.info(f"Server info: {server_info}")
 
+    def _start_request_workers(self):
+        """Start the worker pools that drain availability and assignment queues."""
+        pool_size = max(2, self.options.max_processes // 4)
+        for _ in range(pool_size):
+            self._tasks.add(asyncio.create_task(self._availability_worker()))
+        # Assignment workers only cover the launch handshake; entrypoints run as
+        # separate tasks, so pool slots are not held for the length of a session
+        for _ in range(pool_size):
+            self._tasks.add(asyncio.create_task(self._assignment_worker()))
+
+    async def _availability_worker(self):
+        """Answer queued availability requests one at a time."""
+        while True:
+            request = await self._availability_queue.get()
+            try:
+                await self._answer_availability(request)
+            except Exception as e:
+                logger.error(f"Error answering availability request: {e}")
+
+    async def _assignment_worker(self):
+        """Launch queued job assignments one at a time."""
+        while True:
+            assignment = await self._assignment_queue.get()
+            try:
+                await self._handle_job_assignment(assignment)
+            except Exception as e:
+                logger.error(f"Error handling job assignment: {e}")
+
     def _handle_availability(self, request: AvailabilityRequest):
         """Handle availability request from backend."""
-        logger.info(f"Received availability request for job {request.job_id}")
-        asyncio.create_task(self._answer_availability(request))
+        logger.info("Received availability request for job %s", request.job_id)
+        try:
+            self._availability_queue.put_nowait(request)
+        except asyncio.QueueFull:
+            logger.warning("Availability queue full, rejecting job %s", request.job_id)
+            self._send_nowait(
+                AvailabilityResponse(
+                    job_id=request.job_id,
+                    available=False,
+                    error="Worker backpressure: availability queue full",
+                )
+            )
+
+    @staticmethod
+    def _availability_template(**fields) -> tuple[str, str]:
+        """Serialize an AvailabilityResponse once and split it around its job_id value."""
+        marker = "\x00job_id\x00"
+        payload = json.dumps(AvailabilityResponse(job_id=marker, **fields).dict())
+        prefix, suffix = payload.split(json.dumps(marker))
+        return prefix, suffix
 
     async def _answer_availability(self, request: AvailabilityRequest):
         """Answer availability request."""
         try:
-            # Check if we can accept the job
+            # Check if we can accept the job; the moving average keeps recently
+            # shed load counting for a few seconds so bursts don't thrash admission
+            self._refresh_load_ewma()
             can_accept = (
                 not self._draining
-                and self._worker_load < self.options.load_threshold
-                and len(self._current_jobs) < self.options.max_processes
+                and max(self._worker_load, self._load_ewma) < self.options.load_threshold
+                and self._job_count < self.options.max_processes
             )
 
             if can_accept:
                 # Accept the job and provide our auth token
-                response = AvailabilityResponse(
-                    job_id=request.job_id,
-                    available=True,
-                    token=self.options.auth_token,  # Provide worker's auth token
-                )
-                logger.info(f"Accepting job {request.job_id}")
+                prefix, suffix = self._accept_template
+                logger.info("Accepting job %s", request.job_id)
             else:
                 # Reject the job
-                response = AvailabilityResponse(
-                    job_id=request.job_id,
-                    available=False,
-                    error="Worker at capacity or draining",
-                )
-                logger.info(f"Rejecting job {request.job_id}")
+                prefix, suffix = self._reject_template
+                logger.info("Rejecting job %s", request.job_id)
 
             # Send response
-            await self.backend_connection.send_message(response)
+            await self.backend_connection.send_raw(
+                prefix + json.dumps(request.job_id) + suffix
+            )
 
         except Exception as e:
-            logger.error(f"Error handling availability request: {e}")
+            logger.error("Error handling availability request: %s", e)
             # Send rejection on error
             response = AvailabilityResponse(
                 job_id=request.job_id,
@@ -440,8 +531,51 @@ class Worker:
 
     def _handle_assignment(self, assignment: JobAssignment):
         """Handle job assignment from backend."""
-        logger.info(f"Received job assignment: {assignment.job_id}")
-        asyncio.create_task(self._handle_job_assignment(assignment))
+        logger.info("Received job assignment: %s", assignment.job_id)
+        try:
+            self._assignment_queue.put_nowait(assignment)
+        except asyncio.QueueFull:
+            logger.warning("Assignment queue full, failing job %s", assignment.job_id)
+            self._send_nowait(
+                JobUpdate(
+                    job_id=assignment.job_id,
+                    status="failed",
+                    error="Worker backpressure: assignment queue full",
+                )
+            )
+
+    def _send_nowait(self, message):
+        """Queue a message for the backend from a synchronous handler."""
+        try:
+            self.backend_connection.send_message_nowait(message)
+        except Exception as e:
+            logger.error("Failed to queue message for backend: %s", e)
+
+    def _add_job(self, job_id: str, job_info: RunningJobInfo):
+        """Track a running job and refresh the cached load."""
+        self._current_jobs[job_id] = job_info
+        self._update_job_load()
+
+    def _remove_job(self, job_id: str) -> Optional[RunningJobInfo]:
+        """Stop tracking a job and refresh the cached load."""
+        job_info = self._current_jobs.pop(job_id, None)
+        if job_info is not None:
+            self._update_job_load()
+        return job_info
+
+    def _update_job_load(self):
+        """Recompute the cached job count and load after _current_jobs changes."""
+        # Credit the elapsed interval to the load that held during it
+        self._refresh_load_ewma()
+        self._job_count = len(self._current_jobs)
+        self._worker_load = min(self._job_count / self.options.max_processes, 1.0)
+
+    def _refresh_load_ewma(self):
+        """Decay the load moving average toward the current load by the time elapsed."""
+        now = time.monotonic()
+        alpha = 1.0 - math.exp(-(now - self._load_ewma_ts) / _LOAD_EWMA_TAU)
+        self._load_ewma += alpha * (self._worker_load - self._load_ewma)
+        self._load_ewma_ts = now
 
     async def _handle_job_assignment(self, assignment: JobAssignment):
         """Handle job assignment."""
@@ -457,7 +591,7 @@ class Worker:
             await self._launch_job_from_assignment(assignment, args)
 
         except Exception as e:
-            logger.error(f"Error handling job assignment: {e}")
+            logger.error("Error handling job assignment: %s", e)
             # Send job update with error
             job_update = JobUpdate(
                 job_id=assignment.job_id,
@@ -468,86 +602,106 @@ class Worker:
 
     async def _handle_termination(self, termination: JobTermination):
         """Handle job termination request."""
-        logger.info(f"Received job termination: {termination.job_id}")
+        logger.info("Received job termination: %s", termination.job_id)
+
+        # Remove job from current jobs up front so concurrent handlers see it gone
+        job_info = self._remove_job(termination.job_id)
+        if job_info is None:
+            logger.warning(
+                "Job %s not found in current jobs for termination", termination.job_id
+            )
+            return
 
-        if termination.job_id in self._current_jobs:
-            job_info = self._current_jobs[termination.job_id]
+        logger.info(
+            "Removed job %s from current jobs. Remaining jobs: %d",
+            termination.job_id,
+            self._job_count,
+        )
+
+        try:
+            await job_info.job.shutdown()
+            logger.info("Successfully terminated job %s", termination.job_id)
+        except Exception as e:
+            logger.error("Error terminating job %s: %s", termination.job_id, e)
 
+        # Notify registry about job completion
+        if self.backend_connection and self.backend_connection.is_connected:
             try:
-                await job_info.job.shutdown()
-                logger.info(f"Successfully terminated job {termination.job_id}")
+                job_update = JobUpdate(
+                    job_id=termination.job_id,
+                    status="completed",
+                    error="Job terminated by registry",
+                )
+                self.backend_connection.send_message_nowait(job_update)
+                logger.info(
+                    "Sent job completion update for terminated job %s", termination.job_id
+                )
             except Exception as e:
-                logger.error(f"Error terminating job {termination.job_id}: {e}")
+                logger.error(
+                    "Failed to send job completion update for terminated job %s: %s",
+                    termination.job_id,
+                    e,
+                )
 
-            # Remove job from current jobs
-            del self._current_jobs[termination.job_id]
-            logger.info(
-                f"Removed job {termination.job_id} from current jobs. Remaining jobs: {len(self._current_jobs)}"
-            )
+        # Schedule a status update to reflect reduced job count
+        self._request_status_update()
 
-            # Notify registry about job completion
-            if self.backend_connection and self.backend_connection.is_connected:
-                try:
-                    job_update = JobUpdate(
-                        job_id=termination.job_id,
-                        status="completed",
-                        error="Job terminated by registry",
-                    )
-                    await self.backend_connection.send_message(job_update)
-                    logger.info(
-                        f"Sent job completion update for terminated job {termination.job_id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send job completion update for terminated job {termination.job_id}: {e}"
-                    )
+    async def _handle_meeting_end(self, job_id: str, reason: str = "meeting_ended"):
+        """Handle meeting end/leave events and inform registry."""
+        logger.info("Meeting ended for job %s, reason: %s", job_id, reason)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current jobs: %s", list(self._current_jobs))
 
-            # IMMEDIATELY send status update to reflect reduced job count
-            # This bypasses the debounce mechanism to ensure registry gets correct info
-            await self._send_immediate_status_update()
-        else:
+        # Remove job from worker's current jobs
+        job_info = self._remove_job(job_id)
+        if job_info is None:
             logger.warning(
-                f"Job {termination.job_id} not found in current jobs for termination"
+                "Job %s not found in current jobs when meeting ended", job_id
             )
+            return
 
-    async def _handle_meeting_end(self, job_id: str, reason: str = "meeting_ended"):
-        """Handle meeting end/leave events and inform registry."""
-        logger.info(f"Meeting ended for job {job_id}, reason: {reason}")
         logger.info(
-            f"Checking if job {job_id} is in current_jobs: {job_id in self._current_jobs}"
+            "Removed job %s from worker's current jobs. Remaining jobs: %d",
+            job_id,
+            self._job_count,
         )
-        logger.info(f"Current jobs: {list(self._current_jobs.keys())}")
 
-        if job_id in self._current_jobs:
-            # Remove job from worker's current jobs
-            job_info = self._current_jobs.pop(job_id, None)
-            if job_info:
-                logger.info(
-                    f"Removed job {job_id} from worker's current jobs. Remaining jobs: {len(self._current_jobs)}"
+        # Inform registry about job completion
+        if self.backend_connection and self.backend_connection.is_connected:
+            try:
+                job_update = JobUpdate(
+                    job_id=job_id,
+                    status="completed",
+                    error=f"Meeting ended: {reason}",
                 )
+                self.backend_connection.send_message_nowait(job_update)
+                logger.info("Sent job completion update to registry for job %s", job_id)
+            except Exception as e:
+                logger.error("Failed to send job completion update to registry: %s", e)
 
-            # Inform registry about job completion
-            if self.backend_connection and self.backend_connection.is_connected:
-                try:
-                    job_update = JobUpdate(
-                        job_id=job_id,
-                        status="completed",
-                        error=f"Meeting ended: {reason}",
-                    )
-                    await self.backend_connection.send_message(job_update)
-                    logger.info(
-                        f"Sent job completion update to registry for job {job_id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send job completion update to registry: {e}"
-                    )
+        # Schedule a status update to reflect reduced job count
+        self._request_status_update()
+
+    def _request_status_update(self):
+        """Mark the worker status dirty so the status pump sends an update."""
+        self._status_dirty.set()
 
-            # IMMEDIATELY send status update to reflect reduced job count
-            # This bypasses the debounce mechanism to ensure registry gets correct info
+    async def _status_pump(self):
+        """Send coalesced status updates: one on the leading edge of a burst, one trailing.
+
+        With no events pending, a periodic update is sent every ping_interval.
+        """
+        while not self._shutdown:
+            try:
+                await asyncio.wait_for(
+                    self._status_dirty.wait(), timeout=self.options.ping_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._status_dirty.clear()
+            self._refresh_load_ewma()
             await self._send_immediate_status_update()
-        else:
-            logger.warning(f"Job {job_id} not found in current jobs when meeting ended")
+            await asyncio.sleep(self._status_update_debounce_seconds)
 
     async def _send_immediate_status_update(self):
         """Send an immediate status update, bypassing debounce mechanism."""
@@ -555,108 +709,122 @@ class Worker:
             return
 
         try:
-            # Calculate current load
-            job_count = len(self._current_jobs)
-            load = min(job_count / self.options.max_processes, 1.0)
-            self._worker_load = load
+            job_count = self._job_count
+            load = self._worker_load
 
             logger.info(
-                f"Sending immediate status update - job_count: {job_count}, load: {load}, max_processes: {self.options.max_processes}"
+                "Sending immediate status update - job_count: %d, load: %s, max_processes: %d",
+                job_count,
+                load,
+                self.options.max_processes,
             )
 
             # Log the actual job IDs for debugging
-            if job_count > 0:
-                job_ids = list(self._current_jobs.keys())
-                logger.info(f"Active job IDs: {job_ids}")
-            else:
-                logger.info("No active jobs")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Active job IDs: %s", list(self._current_jobs))
 
             # Send status update
-            status_msg = WorkerMessage(
-                type="status_update",
-                worker_id=self.backend_connection.worker_id,
-                agent_name=self.options.agent_id,
-                status="available" if not self._draining else "draining",
-                load=load,
-                job_count=job_count,
-            )
+            status_msg = self._status_message(load, job_count)
 
             await self.backend_connection.send_message(status_msg)
+            self._worker_load_graph.add_point(load)
             logger.info("Immediate status update sent successfully")
 
         except Exception as e:
-            logger.error(f"Error sending immediate status update: {e}")
+            logger.error("Error sending immediate status update: %s", e)
+
+    def _status_message(self, load: float, job_count: int) -> WorkerMessage:
+        """Return the reusable status_update message refreshed with the current values.
+
+        Only status, load and job_count change between updates. A copy still waiting
+        in the send queue simply goes out with the newest values.
+        """
+        worker_id = self.backend_connection.worker_id
+        status_msg = self._status_msg
+        if status_msg is None or status_msg.worker_id != worker_id:
+            status_msg = self._status_msg = WorkerMessage(
+                type="status_update",
+                worker_id=worker_id,
+                agent_name=self.options.agent_id,
+            )
+        status_msg.status = "available" if not self._draining else "draining"
+        status_msg.load = load
+        status_msg.job_count = job_count
+        return status_msg
 
     def setup_meeting_event_handlers(self, job_context, job_id: str):
         """Set up meeting event handlers for a specific job."""
         if not job_context.room:
             logger.warning(
-                f"Cannot set up meeting handlers for job {job_id}: room not available"
+                "Cannot set up meeting handlers for job %s: room not available", job_id
             )
-            # Set up a delayed handler setup that will be called when room becomes available
-            original_connect = job_context.connect
-
-            def delayed_handler_setup():
-                if job_context.room:
-                    self._setup_meeting_event_handlers_impl(job_context, job_id)
-                else:
-                    logger.warning(
-                        f"Room still not available for job {job_id} after connect"
-                    )
-
-            # Override connect method to set up handlers after room is created
-            async def connect_with_handlers():
-                result = await original_connect()
-                delayed_handler_setup()
-                return result
-
-            job_context.connect = connect_with_handlers
-            logger.info(f"Set up delayed meeting event handlers for job {job_id}")
+            # Set up handlers once connect() has created the room
+            self._when_room_ready(
+                job_context, job_id, self._setup_meeting_event_handlers_impl
+            )
+            logger.info("Set up delayed meeting event handlers for job %s", job_id)
             return
 
         # Room is available, set up handlers immediately
         self._setup_meeting_event_handlers_impl(job_context, job_id)
 
+    def _when_room_ready(self, job_context, job_id: str, setup: Callable[[Any, str], None]):
+        """Run a one-shot setup for a job once its room becomes available."""
+
+        def on_room_ready(future: asyncio.Future):
+            if not future.cancelled() and job_context.room:
+                setup(job_context, job_id)
+            else:
+                logger.warning(
+                    "Room still not available for job %s after connect", job_id
+                )
+
+        job_context._room_ready.add_done_callback(on_room_ready)
+
     def _setup_meeting_event_handlers_impl(self, job_context, job_id: str):
         """Internal method to set up the actual meeting event handlers."""
         if not job_context.room:
-            logger.warning(f"Room not available for job {job_id} in handler setup")
+            logger.warning("Room not available for job %s in handler setup", job_id)
             return
 
         # Store original event handler
         original_on_meeting_left = job_context.room.on_meeting_left
+        has_original = bool(original_on_meeting_left) and callable(original_on_meeting_left)
+
+        # Introspect the original handler once instead of on every event
+        takes_data = False
+        if has_original:
+            try:
+                num_params = len(inspect.signature(original_on_meeting_left).parameters)
+                if hasattr(original_on_meeting_left, '__self__'):
+                    # It's a bound method: self + data
+                    takes_data = num_params > 1
+                else:
+                    # It's a function
+                    takes_data = num_params > 0
+            except (TypeError, ValueError) as e:
+                logger.warning("Could not inspect original on_meeting_left: %s", e)
+                has_original = False
         
         # Create wrapper that calls original and then handles cleanup
         def on_meeting_left_wrapper(data=None):
             # Call original handler first
-            if original_on_meeting_left and callable(original_on_meeting_left):
+            if has_original:
                 try:
-                    # Call as a method with self bound
-                    import inspect
-                    sig = inspect.signature(original_on_meeting_left)
-                    # Check if it's a bound method or function
-                    if hasattr(original_on_meeting_left, '__self__'):
-                        # It's a bound method
-                        if len(sig.parameters) > 1:  # self + data
-                            original_on_meeting_left(data)
-                        else:  # just self
-                            original_on_meeting_left()
+                    if takes_data:
+                        original_on_meeting_left(data)
                     else:
-                        # It's a function
-                        if len(sig.parameters) > 0:
-                            original_on_meeting_left(data)
-                        else:
-                            original_on_meeting_left()
+                        original_on_meeting_left()
                 except Exception as e:
-                    logger.warning(f"Error calling original on_meeting_left: {e}")
+                    logger.warning("Error calling original on_meeting_left: %s", e)
             
             # Handle meeting end for this specific job
-            logger.info(f"Meeting left event - triggering job cleanup for {job_id}")
+            logger.info("Meeting left event - triggering job cleanup for %s", job_id)
             asyncio.create_task(self._handle_meeting_end(job_id, "meeting_left"))
 
         # Replace the handler with our wrapper
         job_context.room.on_meeting_left = on_meeting_left_wrapper
-        logger.info(f"Set up meeting end handler for job {job_id}")
+        logger.info("Set up meeting end handler for job %s", job_id)
 
     async def _launch_job_from_assignment(
         self, assignment: JobAssignment, args: JobAcceptArguments
@@ -684,37 +852,35 @@ class Worker:
             # Apply RoomOptions from assignment if provided
             if assignment.room_options:
                 logger.info(
-                    f"Received room_options from assignment: {assignment.room_options}"
+                    "Received room_options from assignment: %s", assignment.room_options
                 )
                 if "auto_end_session" in assignment.room_options:
                     room_options.auto_end_session = assignment.room_options[
                         "auto_end_session"
                     ]
-                    logger.info(
-                        f"Set auto_end_session: {room_options.auto_end_session}"
-                    )
+                    logger.info("Set auto_end_session: %s", room_options.auto_end_session)
                 if "session_timeout_seconds" in assignment.room_options:
                     room_options.session_timeout_seconds = assignment.room_options[
                         "session_timeout_seconds"
                     ]
                     logger.info(
-                        f"Set session_timeout_seconds: {room_options.session_timeout_seconds}"
+                        "Set session_timeout_seconds: %s", room_options.session_timeout_seconds
                     )
                 if "playground" in assignment.room_options:
                     room_options.playground = assignment.room_options["playground"]
-                    logger.info(f"Set playground: {room_options.playground}")
+                    logger.info("Set playground: %s", room_options.playground)
                 if "vision" in assignment.room_options:
                     room_options.vision = assignment.room_options["vision"]
-                    logger.info(f"Set vision: {room_options.vision}")
+                    logger.info("Set vision: %s", room_options.vision)
                 if "join_meeting" in assignment.room_options:
                     room_options.join_meeting = assignment.room_options["join_meeting"]
-                    logger.info(f"Set join_meeting: {room_options.join_meeting}")
+                    logger.info("Set join_meeting: %s", room_options.join_meeting)
                 if "recording" in assignment.room_options:
                     room_options.recording = assignment.room_options["recording"]
-                    logger.info(f"Set recording: {room_options.recording}")
+                    logger.info("Set recording: %s", room_options.recording)
                 if "agent_participant_id" in assignment.room_options:
                     room_options.agent_participant_id = assignment.room_options["agent_participant_id"]
-                    logger.info(f"Set agent_participant_id: {room_options.agent_participant_id}")
+                    logger.info("Set agent_participant_id: %s", room_options.agent_participant_id)
             else:
                 logger.warning("No room_options received from assignment")
 
@@ -733,9 +899,11 @@ class Worker:
             )
 
             # Store job info BEFORE executing entrypoint
-            self._current_jobs[assignment.job_id] = job_info
+            self._add_job(assignment.job_id, job_info)
             logger.info(
-                f"Added job {assignment.job_id} to worker's current jobs. Total jobs: {len(self._current_jobs)}"
+                "Added job %s to worker's current jobs. Total jobs: %d",
+                assignment.job_id,
+                self._job_count,
             )
 
             # Send job update to registry
@@ -748,51 +916,22 @@ class Worker:
             # Set up session end callback BEFORE executing entrypoint
             # This ensures the callback is set up even if entrypoint fails
             self.setup_session_end_callback(job_context, assignment.job_id)
-            logger.info(f"Session end callback set up for job {assignment.job_id}")
+            logger.info("Session end callback set up for job %s", assignment.job_id)
 
             # Set up meeting event handlers to ensure proper event handling
             self.setup_meeting_event_handlers(job_context, assignment.job_id)
-            logger.info(f"Meeting event handlers set up for job {assignment.job_id}")
-
-            # Execute the job using the worker's entrypoint function
-            logger.info(f"Executing job {assignment.job_id} with entrypoint function")
-
-            try:
-                # Set the current job context so pipeline auto-registration works
-                from .job import _set_current_job_context, _reset_current_job_context
-
-                token = _set_current_job_context(job_context)
-                try:
-                    # Execute the entrypoint function
-                    await self.options.entrypoint_fnc(job_context)
-                    logger.info(
-                        f"Entrypoint function completed for job {assignment.job_id}"
-                    )
-                finally:
-                    pass
-            except Exception as entrypoint_error:
-                logger.error(
-                    f"Entrypoint function failed for job {assignment.job_id}: {entrypoint_error}"
-                )
-                # Don't remove the job from _current_jobs here - let the session end callback handle it
-                # The job should remain active until the session actually ends
-
-                # Send error update but keep job active
-                error_update = JobUpdate(
-                    job_id=assignment.job_id,
-                    status="error",
-                    error=f"Entrypoint failed: {entrypoint_error}",
-                )
-                await self.backend_connection.send_message(error_update)
+            logger.info("Meeting event handlers set up for job %s", assignment.job_id)
 
-            # The job should remain in _current_jobs until the session ends
-            # This ensures the registry sees the correct load and job count
-            logger.info(
-                f"Job {assignment.job_id} remains active in worker's current jobs: {len(self._current_jobs)} total jobs"
+            # Run the entrypoint for the lifetime of the session in its own task so
+            # the assignment pool slot is free again once the launch handshake is done
+            entrypoint_task = asyncio.create_task(
+                self._run_job_entrypoint(assignment.job_id, job_context)
             )
+            self._tasks.add(entrypoint_task)
+            entrypoint_task.add_done_callback(self._tasks.discard)
 
         except Exception as e:
-            logger.error(f"Error launching job {assignment.job_id}: {e}")
+            logger.error("Error launching job %s: %s", assignment.job_id, e)
             # Send error update
             job_update = JobUpdate(
                 job_id=assignment.job_id,
@@ -801,11 +940,49 @@ class Worker:
             )
             await self.backend_connection.send_message(job_update)
             # Remove job from current jobs since it failed to launch
-            self._current_jobs.pop(assignment.job_id, None)
-            logger.info(f"Removed failed job {assignment.job_id} from current jobs")
+            self._remove_job(assignment.job_id)
+            logger.info("Removed failed job %s from current jobs", assignment.job_id)
 
-            # Send immediate status update to reflect reduced job count
-            await self._send_immediate_status_update()
+            # Schedule a status update to reflect reduced job count
+            self._request_status_update()
+
+    async def _run_job_entrypoint(self, job_id: str, job_context: JobContext):
+        """Run the worker's entrypoint function for a launched job."""
+        # Execute the job using the worker's entrypoint function
+        logger.info("Executing job %s with entrypoint function", job_id)
+
+        try:
+            # Set the current job context so pipeline auto-registration works
+            from .job import _set_current_job_context
+
+            _set_current_job_context(job_context)
+            await self.options.entrypoint_fnc(job_context)
+            logger.info("Entrypoint function completed for job %s", job_id)
+        except Exception as entrypoint_error:
+            logger.error(
+                "Entrypoint function failed for job %s: %s", job_id, entrypoint_error
+            )
+            # Don't remove the job from _current_jobs here - let the session end callback handle it
+            # The job should remain active until the session actually ends
+
+            # Send error update but keep job active
+            error_update = JobUpdate(
+                job_id=job_id,
+                status="error",
+                error=f"Entrypoint failed: {entrypoint_error}",
+            )
+            try:
+                await self.backend_connection.send_message(error_update)
+            except Exception as e:
+                logger.error("Failed to send entrypoint error update for job %s: %s", job_id, e)
+
+        # The job should remain in _current_jobs until the session ends
+        # This ensures the registry sees the correct load and job count
+        logger.info(
+            "Job %s remains active in worker's current jobs: %d total jobs",
+            job_id,
+            self._job_count,
+        )
 
     def setup_session_end_callback(self, job_context, job_id: str):
         """Set up session end callback for automatic session ending."""
@@ -813,24 +990,10 @@ class Worker:
             logger.warning(
                 f"Cannot set up session end callback for job {job_id}: room not available"
             )
-            # Set up a delayed callback setup that will be called when room becomes available
-            original_connect = job_context.connect
-
-            def delayed_callback_setup():
-                if job_context.room:
-                    self._setup_session_end_callback_impl(job_context, job_id)
-                else:
-                    logger.warning(
-                        f"Room still not available for job {job_id} after connect"
-                    )
-
-            # Override connect method to set up callback after room is created
-            async def connect_with_callback():
-                result = await original_connect()
-                delayed_callback_setup()
-                return result
-
-            job_context.connect = connect_with_callback
+            # Set up callback once connect() has created the room
+            self._when_room_ready(
+                job_context, job_id, self._setup_session_end_callback_impl
+            )
             logger.info(f"Set up delayed session end callback for job {job_id}")
             return
 
@@ -866,69 +1029,6 @@ class Worker:
         job_context.room.on_session_end = on_session_end_wrapper
         logger.info(f"Session end callback set up for job {job_id}")
 
-    async def _status_update_loop(self):
-        """Periodic status update loop."""
-        while not self._shutdown:
-            try:
-                await self._update_worker_status()
-                await asyncio.sleep(self.options.ping_interval)
-            except Exception as e:
-                logger.error(f"Error in status update loop: {e}")
-                await asyncio.sleep(5)  # Wait before retrying
-
-    async def _update_worker_status(self):
-        """Update worker status with backend."""
-        if not self.backend_connection or not self.backend_connection.is_connected:
-            return
-
-        # Check debounce - don't send status updates too frequently
-        current_time = time.time()
-        if (
-            current_time - self._last_status_update
-            < self._status_update_debounce_seconds
-        ):
-            logger.debug("Skipping status update due to debounce")
-            return
-
-        try:
-            # Calculate current load
-            job_count = len(self._current_jobs)
-            load = min(job_count / self.options.max_processes, 1.0)
-            self._worker_load = load
-
-            # Add detailed logging to track job count changes
-            logger.info(
-                f"Updating worker status - job_count: {job_count}, load: {load}, max_processes: {self.options.max_processes}"
-            )
-
-            # Log the actual job IDs for debugging
-            if job_count > 0:
-                job_ids = list(self._current_jobs.keys())
-                logger.info(f"Active job IDs: {job_ids}")
-            else:
-                logger.info("No active jobs")
-
-            # Send status update
-            status_msg = WorkerMessage(
-                type="status_update",
-                worker_id=self.backend_connection.worker_id,
-                agent_name=self.options.agent_id,  # Include agent_id
-                status="available" if not self._draining else "draining",
-                load=load,
-                job_count=job_count,
-            )
-
-            await self.backend_connection.send_message(status_msg)
-
-            # Update last status update time
-            self._last_status_update = current_time
-
-            # Update tracing
-            self._worker_load_graph.add_point(load)
-
-        except Exception as e:
-            logger.error(f"Error updating worker status: {e}")
-
     async def execute_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a job using the task executor."""
         if not self.process_manager:
@@ -987,14 +1087,10 @@ class Worker:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get worker statistics."""
-        # Calculate current load dynamically
-        job_count = len(self._current_jobs)
-        current_load = min(job_count / self.options.max_processes, 1.0)
-
         stats = {
-            "worker_load": current_load,
+            "worker_load": self._worker_load,
             "draining": self._draining,
-            "current_jobs": job_count,
+            "current_jobs": self._job_count,
             "max_processes": self.options.max_processes,
             "agent_id": self.options.agent_id,
             "register": self.options.register,
@@ -1077,7 +1173,7 @@ class Worker:
 
         logger.info("Draining VideoSDK worker")
         self._draining = True
-        await self._update_worker_status()
+        self._request_status_update()
 
         # Wait for current jobs to complete
         if self._current_jobs:
@@ -1138,6 +1234,7 @@ class Worker:
         
         # Clear all jobs from the worker's state
         self._current_jobs.clear()
+        self._update_job_load()
         logger.info("All jobs cleared from worker")
 
         # Send a final status update reflecting zero jobs
@@ -1147,7 +1244,7 @@ class Worker:
     async def shutdown(self):
         """Shutdown the worker."""
         logger.info("Shutting down VideoSDK worker")
-        self._shutdown = True
+        self._shutdown_evt.set()
         self._draining = True
 
         try:
@@ -1160,7 +1257,14 @@ class Worker:
             # Send final status update to registry
             if self.backend_connection and self.backend_connection.is_connected:
                 try:
-                    await self._update_worker_status()
+                    # Stop the pump first so the final update is the only status write
+                    if self._status_pump_task is not None:
+                        self._status_pump_task.cancel()
+                        try:
+                            await self._status_pump_task
+                        except asyncio.CancelledError:
+                            pass
+                    await self._send_immediate_status_update()
                     logger.info("Sent final status update to registry")
                 except Exception as e:
                     logger.warning(f"Failed to send final status update: {e}")
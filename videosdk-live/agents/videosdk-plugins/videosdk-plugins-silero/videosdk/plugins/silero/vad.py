@@ -3,7 +3,6 @@ from __future__ import annotations
 import numpy as np
 from typing import Any, Literal
 import time
-import asyncio
 from scipy import signal
 from .onnx_runtime import VadModelWrapper, SAMPLE_RATES
 from videosdk.agents.vad import VAD as BaseVAD, VADResponse, VADEventType, VADData
@@ -179,8 +178,7 @@ class SileroVAD(BaseVAD):
                 silence_duration=self._pub_silence_duration
             )
         )
-        if self._vad_callback:
-            asyncio.create_task(self._vad_callback(response))
+        self._dispatch_vad_event(response)
 
     def _reset_model_state(self) -> None:
         """Reset model internal state when errors occur"""